@@ -45,9 +45,16 @@ __version__ = "1.0.0"
 __author__ = "Anoop Kumar"
 __email__ = "support@videototext.app"
 
-from .gui.app import VideoToTextApp
 from .core.models import TranscriptionRequest, TranscriptionResult, ProgressUpdate, ApplicationSettings
 
+
+def __getattr__(name):
+    """Import the GUI on first access so the entry point can parse arguments first."""
+    if name == 'VideoToTextApp':
+        from .gui.app import VideoToTextApp
+        return VideoToTextApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     'VideoToTextApp',
     'TranscriptionRequest', 
@@ -0,0 +1,143 @@
+"""
+Command-line entry point for the Video-to-Text application.
+
+Runs the GUI, or a headless transcription when --headless is given. Used by
+the video-to-text console script, 'python -m app' and the main.py shim.
+"""
+
+import os
+import sys
+import threading
+from functools import lru_cache
+from types import SimpleNamespace
+
+# Long options understood by the fast argv parser: name -> takes a value
+_OPTIONS = {
+    "--headless": False,
+    "--video": True,
+    "--output": True,
+    "--format": True,
+    "--verbose": False
+}
+_FORMATS = frozenset({"txt", "json"})
+_FORMATS_METAVAR = "{txt,json}"
+
+def _output_format(value):
+    """
+    Validate an output format value and intern it.
+    
+    Args:
+        value: Format given on the command line
+        
+    Returns:
+        The interned format string
+    """
+    if value not in _FORMATS:
+        import argparse
+        raise argparse.ArgumentTypeError(f"invalid choice: {value!r} (choose from 'txt', 'json')")
+    return sys.intern(value)
+
+@lru_cache(maxsize=1)
+def _load_app():
+    """Import and return the VideoToTextApp class, reusing it on later calls."""
+    from app import VideoToTextApp
+    return VideoToTextApp
+
+def _preload_app():
+    """Import the application in the background; failures are reported by main()."""
+    try:
+        _load_app()
+    except Exception:
+        pass
+
+@lru_cache(maxsize=1)
+def _get_parser():
+    """Build the argparse parser once, only when help or error output is needed."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Video-to-Text Transcription Tool")
+    parser.add_argument("--headless", action="store_true", help="Run in headless mode")
+    parser.add_argument("--video", type=str, help="Path to input video file (required for headless)")
+    parser.add_argument("--output", type=str, help="Path to output transcript file")
+    parser.add_argument("--format", type=_output_format, default="txt", metavar=_FORMATS_METAVAR, help="Output format (default: txt)")
+    parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
+    return parser
+
+def _parse_argv(argv):
+    """
+    Parse the common command lines without importing argparse.
+    
+    Args:
+        argv: Command-line arguments, excluding the program name
+        
+    Returns:
+        Parsed arguments, or None for anything outside the simple forms
+        (help, unknown or abbreviated options, missing or invalid values)
+        so the caller can fall back to argparse for its exact behaviour
+    """
+    args = {"headless": False, "video": None, "output": None, "format": "txt", "verbose": False}
+    index = 0
+    while index < len(argv):
+        option, has_inline, inline_value = argv[index].partition("=")
+        takes_value = _OPTIONS.get(option)
+        if takes_value is None:
+            return None
+        if not takes_value:
+            if has_inline:
+                return None
+            args[option[2:]] = True
+        elif has_inline:
+            args[option[2:]] = inline_value
+        else:
+            index += 1
+            if index == len(argv) or argv[index].startswith("-"):
+                return None
+            args[option[2:]] = argv[index]
+        index += 1
+    if args["format"] not in _FORMATS:
+        return None
+    args["format"] = sys.intern(args["format"])
+    return SimpleNamespace(**args)
+
+def main():
+    """Main entry point for the application."""
+    argv = sys.argv[1:]
+    args = _parse_argv(argv)
+    if args is None:
+        args = _get_parser().parse_args(argv)
+
+    # Validate headless arguments
+    if args.headless and not args.video:
+        _get_parser().error("--video is required when using --headless")
+
+    try:
+        if args.headless:
+            # Overlap the slow application import with the input file check so
+            # a missing file is reported without waiting for the import
+            loader = threading.Thread(target=_preload_app, daemon=True)
+            loader.start()
+            if not os.path.exists(args.video):
+                print(f"Error: Input file not found: {args.video}")
+                sys.exit(1)
+            loader.join()
+
+        app_class = _load_app()
+        
+        app = app_class(
+            headless=args.headless,
+            input_file=args.video,
+            output_file=args.output,
+            output_format=args.format,
+            verbose=args.verbose
+        )
+        app.run()
+    except KeyboardInterrupt:
+        sys.exit(0)
+    except ImportError as e:
+        print(f"Error importing dependencies: {e}")
+        sys.exit(1)
+    except (OSError, RuntimeError, ValueError) as e:
+        print(f"An unexpected error occurred: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
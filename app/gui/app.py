@@ -58,6 +58,7 @@ from .results_panel import ResultsPanel
 from ..services.transcription_controller import TranscriptionController
 from ..services.transcription_service import TranscriptionService
 from ..utils.settings_manager import SettingsManager
+from ..utils.performance_monitor import get_performance_monitor
 from ..utils.file_manager import FileManager
 from ..core.models import TranscriptionRequest, TranscriptionResult, ProgressUpdate
 from ..utils.error_handler import initialize_error_handler
@@ -438,6 +439,11 @@ class VideoToTextApp:
             verbose_enabled = self.configuration_panel.is_verbose_enabled()
             if hasattr(self.progress_panel, 'set_verbose_mode'):
                 self.progress_panel.set_verbose_mode(verbose_enabled)
+        
+        # Deliver performance monitor callbacks on the Tk thread instead of
+        # the sampler thread, since widgets must only be touched from here
+        if self.main_window and self.main_window.root:
+            get_performance_monitor().schedule_callback_drain(self.main_window.root)
     
     def _setup_event_handlers(self) -> None:
         """Set up application-level event handlers."""
@@ -685,6 +691,7 @@ class VideoToTextApp:
             # Clean up temporary files
             if self.file_manager:
                 self.file_manager.cleanup_temp_files()
+                self.file_manager.release_temp_pool()
             
         except Exception as e:
             # Error during cleanup
@@ -813,9 +820,10 @@ class VideoToTextApp:
             if self.results_panel:
                 self.results_panel.reset()
             
-            # Clean up temporary files
+            # Clean up temporary files; directories are removed in the background
+            # so resetting does not block the UI thread
             if self.file_manager:
-                self.file_manager.cleanup_temp_files()
+                self.file_manager.cleanup_temp_files(sync=False)
             
             # Update UI state
             self._update_transcription_availability()
@@ -7,7 +7,7 @@ This module provides comprehensive error handling and user-friendly error messag
 import os
 import sys
 import traceback
-from typing import Optional, Callable, Any, Dict, List
+from typing import Optional, Callable, Any, Dict, Tuple, Type
 from enum import Enum
 import tkinter as tk
 from tkinter import messagebox
@@ -36,6 +36,54 @@ class ErrorCategory(Enum):
     UNKNOWN = "UNKNOWN"
 
 
+# Fixed messages keyed by (category, exception type)
+_MESSAGES: Dict[Tuple[ErrorCategory, Type[BaseException]], str] = {
+    (ErrorCategory.FILE_SYSTEM, FileNotFoundError):
+        "The specified file could not be found. Please check the file path and try again.",
+    (ErrorCategory.FILE_SYSTEM, PermissionError):
+        "Permission denied. Please check file permissions and try again.",
+}
+
+# Message prefixes used when no fixed message matches
+_CATEGORY_MESSAGE_PREFIXES: Dict[ErrorCategory, str] = {
+    ErrorCategory.FILE_SYSTEM: "File operation failed",
+    ErrorCategory.VIDEO_PROCESSING: "Video processing failed",
+    ErrorCategory.SPEECH_RECOGNITION: "Speech recognition failed",
+    ErrorCategory.SETTINGS: "Settings operation failed",
+    ErrorCategory.GUI: "Interface error",
+}
+
+# General suggestions appended to every category-specific list
+_GENERAL_SUGGESTIONS: Tuple[str, ...] = (
+    "Try the operation again",
+    "Restart the application"
+)
+
+# Suggestions keyed by (category, exception type); None matches any exception type
+_SUGGESTIONS: Dict[Tuple[ErrorCategory, Optional[Type[BaseException]]], Tuple[str, ...]] = {
+    (ErrorCategory.FILE_SYSTEM, FileNotFoundError): (
+        "Check that the file path is correct",
+        "Verify that the file exists",
+        "Try browsing for the file instead of typing the path"
+    ) + _GENERAL_SUGGESTIONS,
+    (ErrorCategory.FILE_SYSTEM, PermissionError): (
+        "Check file permissions",
+        "Try running the application as administrator",
+        "Make sure the file is not open in another program"
+    ) + _GENERAL_SUGGESTIONS,
+    (ErrorCategory.VIDEO_PROCESSING, None): (
+        "Check that the video file is not corrupted",
+        "Try a different video format",
+        "Ensure the video file is not too large"
+    ) + _GENERAL_SUGGESTIONS,
+    (ErrorCategory.SPEECH_RECOGNITION, None): (
+        "Check your internet connection",
+        "Try a video with clearer audio",
+        "Ensure the video contains speech"
+    ) + _GENERAL_SUGGESTIONS,
+}
+
+
 class ErrorHandler:
     """
     Centralized error handling system with user feedback.
@@ -81,12 +129,15 @@ class ErrorHandler:
         # Increment error count for this category
         self._error_counts[category] += 1
         
+        # Nothing will be displayed, so skip building the error details
+        if not self._will_show_dialog(show_dialog):
+            return
+        
         # Generate error details
         error_details = self._generate_error_details(error, category, severity, context)
         
         # Display user-friendly message
-        if show_dialog:
-            self._show_error_dialog(error_details["user_message"], severity, error_details)
+        self._show_error_dialog(error_details["user_message"], severity, error_details)
     
     def handle_file_error(self, operation: str, filepath: str, error: Exception, 
                          show_dialog: bool = True) -> None:
@@ -99,11 +150,13 @@ class ErrorHandler:
             error: The exception that occurred
             show_dialog: Whether to show a dialog to the user
         """
-        context = {
-            "operation": operation,
-            "filepath": filepath,
-            "file_exists": os.path.exists(filepath) if filepath else False
-        }
+        context = None
+        if self._will_show_dialog(show_dialog):
+            context = {
+                "operation": operation,
+                "filepath": filepath,
+                "file_exists": os.path.exists(filepath) if filepath else False
+            }
         
         self.handle_error(
             error, 
@@ -123,10 +176,12 @@ class ErrorHandler:
             video_path: Path to the video file being processed
             show_dialog: Whether to show a dialog to the user
         """
-        context = {
-            "video_path": video_path,
-            "video_exists": os.path.exists(video_path) if video_path else False
-        }
+        context = None
+        if self._will_show_dialog(show_dialog):
+            context = {
+                "video_path": video_path,
+                "video_exists": os.path.exists(video_path) if video_path else False
+            }
         
         self.handle_error(
             error,
@@ -160,7 +215,7 @@ class ErrorHandler:
             operation: Description of the settings operation that failed
             show_dialog: Whether to show a dialog to the user
         """
-        context = {"operation": operation}
+        context = {"operation": operation} if self._will_show_dialog(show_dialog) else None
         
         self.handle_error(
             error,
@@ -179,7 +234,7 @@ class ErrorHandler:
             component: Name of the GUI component that caused the error
             show_dialog: Whether to show a dialog to the user
         """
-        context = {"component": component}
+        context = {"component": component} if self._will_show_dialog(show_dialog) else None
         
         self.handle_error(
             error,
@@ -189,6 +244,18 @@ class ErrorHandler:
             show_dialog
         )
     
+    def _will_show_dialog(self, show_dialog: bool) -> bool:
+        """
+        Check whether an error reported with the given flag will reach the user.
+        
+        Args:
+            show_dialog: Whether the caller requested a dialog
+            
+        Returns:
+            True if error details will be displayed
+        """
+        return show_dialog and self._show_dialogs
+    
     def _generate_error_details(self, error: Exception, category: ErrorCategory,
                               severity: ErrorSeverity, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -208,7 +275,7 @@ class ErrorHandler:
             "error_message": str(error),
             "category": category.value,
             "severity": severity.value,
-            "traceback": traceback.format_exc(),
+            "traceback_summary": traceback.extract_tb(error.__traceback__),
             "context": context or {},
             "user_message": self._generate_user_friendly_message(error, category),
             "suggestions": self._generate_suggestions(error, category)
@@ -225,28 +292,12 @@ class ErrorHandler:
         Returns:
             User-friendly error message
         """
-        if category == ErrorCategory.FILE_SYSTEM:
-            if isinstance(error, FileNotFoundError):
-                return "The specified file could not be found. Please check the file path and try again."
-            elif isinstance(error, PermissionError):
-                return "Permission denied. Please check file permissions and try again."
-            else:
-                return f"File operation failed: {str(error)}"
-        
-        elif category == ErrorCategory.VIDEO_PROCESSING:
-            return f"Video processing failed: {str(error)}"
-        
-        elif category == ErrorCategory.SPEECH_RECOGNITION:
-            return f"Speech recognition failed: {str(error)}"
-        
-        elif category == ErrorCategory.SETTINGS:
-            return f"Settings operation failed: {str(error)}"
-        
-        elif category == ErrorCategory.GUI:
-            return f"Interface error: {str(error)}"
-        
-        else:
-            return f"An error occurred: {str(error)}"
+        for error_type in type(error).__mro__:
+            message = _MESSAGES.get((category, error_type))
+            if message is not None:
+                return message
+        prefix = _CATEGORY_MESSAGE_PREFIXES.get(category, "An error occurred")
+        return f"{prefix}: {str(error)}"
     
     def _show_error_dialog(self, message: str, severity: ErrorSeverity,
                           error_details: Dict[str, Any]) -> None:
@@ -276,7 +327,7 @@ class ErrorHandler:
             else:
                 messagebox.showinfo("Information", message)
     
-    def _generate_suggestions(self, error: Exception, category: ErrorCategory) -> List[str]:
+    def _generate_suggestions(self, error: Exception, category: ErrorCategory) -> Tuple[str, ...]:
         """
         Generate helpful suggestions for resolving the error.
         
@@ -285,45 +336,13 @@ class ErrorHandler:
             category: Category of the error
             
         Returns:
-            List of suggestions for resolving the error
+            Tuple of suggestions for resolving the error
         """
-        suggestions = []
-        
-        if category == ErrorCategory.FILE_SYSTEM:
-            if isinstance(error, FileNotFoundError):
-                suggestions.extend([
-                    "Check that the file path is correct",
-                    "Verify that the file exists",
-                    "Try browsing for the file instead of typing the path"
-                ])
-            elif isinstance(error, PermissionError):
-                suggestions.extend([
-                    "Check file permissions",
-                    "Try running the application as administrator",
-                    "Make sure the file is not open in another program"
-                ])
-        
-        elif category == ErrorCategory.VIDEO_PROCESSING:
-            suggestions.extend([
-                "Check that the video file is not corrupted",
-                "Try a different video format",
-                "Ensure the video file is not too large"
-            ])
-        
-        elif category == ErrorCategory.SPEECH_RECOGNITION:
-            suggestions.extend([
-                "Check your internet connection",
-                "Try a video with clearer audio",
-                "Ensure the video contains speech"
-            ])
-        
-        # Add general suggestions
-        suggestions.extend([
-            "Try the operation again",
-            "Restart the application"
-        ])
-        
-        return suggestions
+        for error_type in type(error).__mro__:
+            suggestions = _SUGGESTIONS.get((category, error_type))
+            if suggestions is not None:
+                return suggestions
+        return _SUGGESTIONS.get((category, None), _GENERAL_SUGGESTIONS)
     
     def get_error_counts(self) -> Dict[str, int]:
         """
@@ -339,6 +358,25 @@ class ErrorHandler:
         self._error_counts = {cat: 0 for cat in ErrorCategory}
 
 
+def format_traceback(error_details: Dict[str, Any]) -> str:
+    """
+    Format the traceback stored in error details.
+    
+    The traceback is kept as a frame summary and only rendered to text
+    when a consumer actually needs it.
+    
+    Args:
+        error_details: Error details produced by the error handler
+        
+    Returns:
+        Formatted traceback text, or an empty string if none was captured
+    """
+    summary = error_details.get("traceback_summary")
+    if not summary:
+        return ""
+    return "".join(traceback.format_list(summary))
+
+
 # Global error handler instance
 _global_error_handler: Optional[ErrorHandler] = None
 
@@ -7,13 +7,19 @@ proper cleanup.
 """
 
 import os
+import atexit
+import errno
+import heapq
 import json
 import tempfile
 import shutil
+import stat
 import threading
+import time
 import weakref
-from pathlib import Path
-from typing import List, Optional, Set
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Deque, Dict, FrozenSet, List, Optional, Set, Tuple
 from datetime import datetime
 
 from ..core.interfaces import IFileManager
@@ -22,6 +28,46 @@ from .validation import FileValidator, ValidationResult
 from .platform_utils import PathUtils, PLATFORM
 
 
+# Reusable JSON encoders for transcript output
+_JSON_PRETTY_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+_JSON_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+# Mode for newly created transcripts, as a plain open() would give them. The
+# umask is read once at import, since reading it means briefly changing it.
+_umask = os.umask(0)
+os.umask(_umask)
+_NEW_FILE_MODE = 0o666 & ~_umask
+del _umask
+
+
+# Workers shared by all FileManager instances for background temp directory removal
+_cleanup_executor: Optional[ThreadPoolExecutor] = None
+_cleanup_executor_lock = threading.Lock()
+
+
+def _get_cleanup_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared cleanup workers, starting them on first use.
+    
+    Returns:
+        Thread pool used for background directory removal
+    """
+    global _cleanup_executor
+    with _cleanup_executor_lock:
+        if _cleanup_executor is None:
+            _cleanup_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='fm-cleanup')
+            atexit.register(_drain_cleanup_executor)
+        return _cleanup_executor
+
+
+def _drain_cleanup_executor() -> None:
+    """Wait for background directory removals to finish and stop the workers."""
+    with _cleanup_executor_lock:
+        executor = _cleanup_executor
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
 class FileManager(IFileManager):
     """
     Handles file operations for video processing and transcript management.
@@ -31,22 +77,65 @@ class FileManager(IFileManager):
     """
     
     # Supported video file extensions
-    SUPPORTED_VIDEO_EXTENSIONS = {
+    SUPPORTED_VIDEO_EXTENSIONS: FrozenSet[str] = frozenset({
         '.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', 
         '.m4v', '.3gp', '.ogv', '.ts', '.mts', '.m2ts'
-    }
+    })
+    _SORTED_EXTENSIONS: Tuple[str, ...] = tuple(sorted(SUPPORTED_VIDEO_EXTENSIONS))
+    
+    # File extension for each output format
+    _FORMAT_TO_EXT: Dict[str, str] = {'txt': '.txt', 'json': '.json'}
+    
+    DEFAULT_TEMP_PREFIX = 'vid2text_'
+    
+    # Payloads at least this large are preallocated before writing
+    PREALLOCATE_THRESHOLD = 64 * 1024
     
     def __init__(self):
         """Initialize the FileManager with temporary file tracking."""
-        self._temp_files: Set[str] = set()
+        # Tracked temp files, mapped to the (prefix, suffix) they were created with
+        self._temp_files: Dict[str, Tuple[str, str]] = {}
         self._temp_dirs: Set[str] = set()
-        self._cleanup_lock = threading.Lock()
+        # Files and directories are tracked independently; take both in this order
+        self._files_lock = threading.Lock()
+        self._dirs_lock = threading.Lock()
         self._cleanup_callbacks = weakref.WeakSet()
         self.error_handler = get_error_handler()
         self.validator = FileValidator()
         
         self._max_temp_files = 50
         self._cleanup_threshold = 10
+        
+        # Pool of emptied temp files kept for reuse, keyed by (prefix, suffix).
+        # Pooled files live in a private directory that is removed when this
+        # manager is released, garbage collected, or the interpreter exits.
+        self._temp_pool: Dict[Tuple[str, str], Deque[str]] = {}
+        self._pool_size = 0
+        self._pool_capacity = 16
+        self._pool_dir: Optional[str] = None
+        self._pool_finalizer: Optional[weakref.finalize] = None
+        
+        # Short-lived stat results shared within one stats/cleanup pass
+        self._stat_cache: Dict[str, Tuple[Optional[os.stat_result], float]] = {}
+        self._stat_cache_ttl = 0.1
+        
+        # Output directories already known to exist
+        self._known_dirs: Set[str] = set()
+        
+        # Write JSON transcripts without indentation
+        self.compact_json = False
+        
+        # Transcript encoder for each output format
+        self._encoders: Dict[str, Callable[[str], bytes]] = {
+            'txt': self._encode_txt,
+            'json': self._encode_json
+        }
+        
+        # Transcript writer for each output format
+        self._savers: Dict[str, Callable[[str, str], bool]] = {
+            'txt': self._save_as_txt,
+            'json': self._save_as_json
+        }
     
     def validate_video_file(self, filepath: str) -> bool:
         """
@@ -58,7 +147,15 @@ class FileManager(IFileManager):
         Returns:
             True if the file is valid, False otherwise
         """
+        # Reject missing or non-path values and unsupported extensions
+        # before touching the filesystem
+        if not isinstance(filepath, (str, os.PathLike)):
+            return False
+        
         try:
+            if os.path.splitext(filepath)[1].lower() not in self.SUPPORTED_VIDEO_EXTENSIONS:
+                return False
+            
             result = self.validator.validate_video_file(filepath)
             return result.is_valid
         except Exception as e:
@@ -100,7 +197,7 @@ class FileManager(IFileManager):
         Returns:
             List of supported file extensions including the dot
         """
-        return sorted(list(self.SUPPORTED_VIDEO_EXTENSIONS))
+        return list(self._SORTED_EXTENSIONS)
     
     def save_transcript(self, text: str, filepath: str, format: str) -> bool:
         """
@@ -123,26 +220,26 @@ class FileManager(IFileManager):
             return False
         
         try:
-            path = Path(filepath)
-            
             # Create parent directories if they don't exist
-            path.parent.mkdir(parents=True, exist_ok=True)
-            
-            format_lower = format.lower()
+            parent = os.path.dirname(filepath)
+            if parent and parent not in self._known_dirs:
+                os.makedirs(parent, exist_ok=True)
+                self._known_dirs.add(parent)
             
-            if format_lower == 'txt':
-                return self._save_as_txt(text, path)
-            elif format_lower == 'json':
-                return self._save_as_json(text, path)
-            else:
+            saver = self._savers.get(format.lower())
+            if saver is None:
                 self.error_handler.handle_validation_error(
                     "output format",
                     f"Unsupported format: {format}",
                     show_dialog=False
                 )
                 return False
+            
+            return saver(text, filepath)
                 
         except (OSError, PermissionError) as e:
+            # The directory may have been removed since it was last seen
+            self._known_dirs.discard(os.path.dirname(filepath))
             self.error_handler.handle_file_error("save transcript", filepath, e, show_dialog=True)
             return False
         except (ValueError, json.JSONDecodeError) as e:
@@ -154,57 +251,234 @@ class FileManager(IFileManager):
                                           user_message=f"Unexpected error saving transcript: {str(e)}", show_dialog=True)
             return False
     
-    def _save_as_txt(self, text: str, path: Path) -> bool:
+    def _save_as_txt(self, text: str, path: str) -> bool:
         """
         Save transcript as plain text file.
         
         Args:
             text: The transcript text to save
-            path: Path object for the output file
+            path: Path to the output file
             
         Returns:
             True if save was successful, False otherwise
         """
         try:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(text)
+            self._write_payload(path, self._encode_txt(text))
             return True
         except (OSError, PermissionError) as e:
-            self.error_handler.handle_file_error("save as TXT", str(path), e, show_dialog=False)
+            self._known_dirs.discard(os.path.dirname(path))
+            self.error_handler.handle_file_error("save as TXT", path, e, show_dialog=False)
             return False
     
-    def _save_as_json(self, text: str, path: Path) -> bool:
+    def _save_as_json(self, text: str, path: str) -> bool:
         """
         Save transcript as JSON file with metadata.
         
         Args:
             text: The transcript text to save
-            path: Path object for the output file
+            path: Path to the output file
             
         Returns:
             True if save was successful, False otherwise
         """
         try:
-            transcript_data = {
-                "transcript": text,
-                "timestamp": datetime.now().isoformat(),
-                "format_version": "1.0",
-                "word_count": len(text.split()) if text else 0,
-                "character_count": len(text)
-            }
-            
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(transcript_data, f, indent=2, ensure_ascii=False)
+            self._write_payload(path, self._encode_json(text))
             return True
         except (OSError, PermissionError) as e:
-            self.error_handler.handle_file_error("save as JSON", str(path), e, show_dialog=False)
+            self._known_dirs.discard(os.path.dirname(path))
+            self.error_handler.handle_file_error("save as JSON", path, e, show_dialog=False)
             return False
         except json.JSONDecodeError as e:
             self.error_handler.handle_error(e, category=ErrorCategory.FILE_SYSTEM, 
                                           user_message=f"Error encoding JSON data: {str(e)}", show_dialog=False)
             return False
     
-    def create_temp_file(self, suffix: str = '', prefix: str = 'vid2text_') -> Optional[str]:
+    def _encode_txt(self, text: str) -> bytes:
+        """
+        Encode a transcript as plain text.
+        
+        Args:
+            text: The transcript text
+            
+        Returns:
+            UTF-8 encoded file contents
+        """
+        return text.encode('utf-8')
+    
+    def _encode_json(self, text: str) -> bytes:
+        """
+        Encode a transcript as JSON with metadata.
+        
+        Args:
+            text: The transcript text
+            
+        Returns:
+            UTF-8 encoded file contents
+        """
+        transcript_data = {
+            "transcript": text,
+            "timestamp": datetime.now().isoformat(),
+            "format_version": "1.0",
+            "word_count": len(text.split()) if text else 0,
+            "character_count": len(text)
+        }
+        
+        encoder = _JSON_COMPACT_ENCODER if self.compact_json else _JSON_PRETTY_ENCODER
+        return encoder.encode(transcript_data).encode('utf-8')
+    
+    def save_transcripts_batch(self, items: List[Tuple[str, str, str]]) -> List[bool]:
+        """
+        Save several transcripts and flush them to disk together.
+        
+        All payloads are written first, then each file is synced and moved into
+        place, so the durability cost is paid once per batch instead of being
+        interleaved with the writes.
+        
+        Args:
+            items: Tuples of (text, filepath, format) to save
+            
+        Returns:
+            Per-item success flags, in the same order as items
+        """
+        results = [False] * len(items)
+        written: List[Tuple[int, int, str, str]] = []
+        sync = getattr(os, 'fdatasync', os.fsync)
+        
+        try:
+            for index, (text, filepath, format) in enumerate(items):
+                encode = self._encoders.get(format.lower()) if format else None
+                if not text or not filepath or encode is None:
+                    continue
+                
+                try:
+                    parent = os.path.dirname(filepath)
+                    if parent and parent not in self._known_dirs:
+                        os.makedirs(parent, exist_ok=True)
+                        self._known_dirs.add(parent)
+                    
+                    fd, tmp_path, target = self._open_sibling_temp(filepath)
+                except (OSError, PermissionError) as e:
+                    self._known_dirs.discard(os.path.dirname(filepath))
+                    self.error_handler.handle_file_error("save transcript", filepath, e, show_dialog=False)
+                    continue
+                
+                written.append((index, fd, tmp_path, target))
+                try:
+                    self._write_fd(fd, encode(text))
+                except (OSError, PermissionError) as e:
+                    written.pop()
+                    os.close(fd)
+                    self._remove_quietly(tmp_path)
+                    self.error_handler.handle_file_error("save transcript", filepath, e, show_dialog=False)
+            
+            # Second pass: flush, close and publish each file
+            while written:
+                index, fd, tmp_path, target = written.pop(0)
+                try:
+                    try:
+                        sync(fd)
+                    finally:
+                        os.close(fd)
+                    os.replace(tmp_path, target)
+                    results[index] = True
+                except (OSError, PermissionError) as e:
+                    self._remove_quietly(tmp_path)
+                    self.error_handler.handle_file_error("save transcript", items[index][1], e, show_dialog=False)
+        finally:
+            # Anything still open here failed during the write pass
+            for _, fd, tmp_path, _ in written:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+                self._remove_quietly(tmp_path)
+        
+        return results
+    
+    @staticmethod
+    def _remove_quietly(path: str) -> None:
+        """
+        Remove a file, ignoring errors.
+        
+        Args:
+            path: Path to the file
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _open_sibling_temp(path: str) -> Tuple[int, str, str]:
+        """
+        Create a uniquely named temporary file next to an output file.
+        
+        A symlinked output is resolved so the link itself survives the final
+        replace. The temporary file takes the mode of the existing output, or
+        the default mode for a new file.
+        
+        Args:
+            path: Path to the output file
+            
+        Returns:
+            Tuple of (open file descriptor, temporary file path, resolved output path)
+        """
+        target = os.path.realpath(path)
+        parent, name = os.path.split(target)
+        fd, tmp_path = tempfile.mkstemp(prefix='.' + name + '.', suffix='.tmp', dir=parent)
+        try:
+            mode = stat.S_IMODE(os.stat(target).st_mode)
+        except OSError:
+            mode = _NEW_FILE_MODE
+        try:
+            os.chmod(tmp_path, mode)
+        except OSError:
+            pass
+        return fd, tmp_path, target
+    
+    def _write_fd(self, fd: int, payload: bytes) -> None:
+        """
+        Write a full payload to an open file descriptor.
+        
+        Large payloads are preallocated first to avoid block allocation stalls.
+        
+        Args:
+            fd: File descriptor opened for writing
+            payload: Encoded file contents
+        """
+        if len(payload) >= self.PREALLOCATE_THRESHOLD and hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(fd, 0, len(payload))
+            except OSError:
+                # Preallocation is only an optimization; not every filesystem supports it
+                pass
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    
+    def _write_payload(self, path: str, payload: bytes) -> None:
+        """
+        Atomically write an encoded payload to a file with raw OS writes.
+        
+        The payload goes to a sibling temporary file that replaces the target
+        only once it is completely written, so a crash never leaves a partial file.
+        
+        Args:
+            path: Path to the output file
+            payload: Encoded file contents
+        """
+        fd, tmp_path, target = self._open_sibling_temp(path)
+        try:
+            try:
+                self._write_fd(fd, payload)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, target)
+        except BaseException:
+            self._remove_quietly(tmp_path)
+            raise
+    
+    def create_temp_file(self, suffix: str = '', prefix: str = DEFAULT_TEMP_PREFIX) -> Optional[str]:
         """
         Create a temporary file and track it for cleanup with automatic management.
         
@@ -215,16 +489,18 @@ class FileManager(IFileManager):
         Returns:
             Path to the created temporary file, or None if creation failed
         """
-        with self._cleanup_lock:
-            if len(self._temp_files) >= self._cleanup_threshold:
-                self._cleanup_old_temp_files()
+        # len() of a set is atomic, so only take the lock when cleanup is due
+        if len(self._temp_files) > self._cleanup_threshold:
+            with self._files_lock:
+                if len(self._temp_files) > self._cleanup_threshold:
+                    self._cleanup_old_temp_files()
         
         try:
-            fd, temp_path = tempfile.mkstemp(suffix=suffix, prefix=prefix)
-            os.close(fd)
+            temp_path = self._new_temp_file(suffix, prefix)
             
-            with self._cleanup_lock:
-                self._temp_files.add(temp_path)
+            with self._files_lock:
+                self._temp_files[temp_path] = (prefix, suffix)
+                self._stat_cache.pop(temp_path, None)
                 
                 if len(self._temp_files) > self._max_temp_files:
                     self._cleanup_old_temp_files()
@@ -234,6 +510,143 @@ class FileManager(IFileManager):
         except (OSError, PermissionError):
             return None
     
+    def create_temp_files(self, count: int, suffix: str = '', prefix: str = DEFAULT_TEMP_PREFIX) -> List[str]:
+        """
+        Create several temporary files at once and track them for cleanup.
+        
+        Tracking and threshold cleanup are done once for the whole batch
+        instead of once per file.
+        
+        Args:
+            count: Number of temporary files to create
+            suffix: File extension or suffix for the temp files
+            prefix: Prefix for the temp file names
+            
+        Returns:
+            Paths to the created temporary files (may be shorter than count on failure)
+        """
+        # len() of a set is atomic, so only take the lock when cleanup is due
+        if len(self._temp_files) > self._cleanup_threshold:
+            with self._files_lock:
+                if len(self._temp_files) > self._cleanup_threshold:
+                    self._cleanup_old_temp_files()
+        
+        created: List[str] = []
+        for _ in range(count):
+            try:
+                created.append(self._new_temp_file(suffix, prefix))
+            except (OSError, PermissionError):
+                break
+        
+        with self._files_lock:
+            self._temp_files.update(dict.fromkeys(created, (prefix, suffix)))
+            for temp_path in created:
+                self._stat_cache.pop(temp_path, None)
+            
+            if len(self._temp_files) > self._max_temp_files:
+                self._cleanup_old_temp_files()
+        
+        return created
+    
+    def _new_temp_file(self, suffix: str, prefix: str) -> str:
+        """
+        Get an empty temporary file, reusing a pooled one when available.
+        
+        Args:
+            suffix: File extension or suffix for the temp file
+            prefix: Prefix for the temp file name
+            
+        Returns:
+            Path to an empty temporary file
+        """
+        while True:
+            with self._files_lock:
+                pooled = self._temp_pool.get((prefix, suffix))
+                if not pooled:
+                    break
+                temp_path = pooled.popleft()
+                self._pool_size -= 1
+            
+            if os.path.isfile(temp_path):
+                return temp_path
+            # Pooled file vanished, try the next one
+        
+        fd, temp_path = tempfile.mkstemp(suffix=suffix, prefix=prefix)
+        os.close(fd)
+        return temp_path
+    
+    def _offer_to_pool(self, temp_file: str, pool_key: Tuple[str, str]) -> bool:
+        """
+        Park an emptied temporary file in the reuse pool instead of deleting it.
+        
+        Must be called with the files lock held.
+        
+        Args:
+            temp_file: Path to the temporary file
+            pool_key: (prefix, suffix) the file was created with
+            
+        Returns:
+            True if the file was pooled, False if the pool is full or pooling failed
+        """
+        if self._pool_size >= self._pool_capacity:
+            return False
+        
+        name = os.path.basename(temp_file)
+        pool_dir = self._get_pool_dir()
+        if pool_dir is None:
+            return False
+        
+        # Files handed out from the pool are already inside the pool directory
+        pooled_path = os.path.join(pool_dir, name)
+        if pooled_path != temp_file and os.path.lexists(pooled_path):
+            return False
+        
+        try:
+            os.truncate(temp_file, 0)
+            if pooled_path != temp_file:
+                os.replace(temp_file, pooled_path)
+        except OSError:
+            return False
+        
+        self._temp_pool.setdefault(pool_key, deque()).append(pooled_path)
+        self._pool_size += 1
+        return True
+    
+    def _get_pool_dir(self) -> Optional[str]:
+        """
+        Get the private directory holding pooled temp files, creating it on first use.
+        
+        Must be called with the files lock held.
+        
+        Returns:
+            Path to the pool directory, or None if it cannot be created
+        """
+        if self._pool_dir is None:
+            try:
+                self._pool_dir = tempfile.mkdtemp(prefix=self.DEFAULT_TEMP_PREFIX + 'pool_')
+            except OSError:
+                return None
+            # The finalizer must not reference self, or it would keep the manager alive
+            self._pool_finalizer = weakref.finalize(self, shutil.rmtree, self._pool_dir, True)
+        return self._pool_dir
+    
+    def release_temp_pool(self) -> None:
+        """
+        Delete all pooled temp files and the pool directory.
+        
+        Intended for final cleanup, after cleanup_temp_files, when the manager
+        will not create further temp files.
+        """
+        with self._files_lock:
+            self._temp_pool.clear()
+            self._pool_size = 0
+            self._pool_dir = None
+            finalizer = self._pool_finalizer
+            self._pool_finalizer = None
+        
+        if finalizer is not None:
+            finalizer()
+    
     def create_temp_dir(self, prefix: str = 'vid2text_') -> Optional[str]:
         """
         Create a temporary directory and track it for cleanup.
@@ -246,76 +659,160 @@ class FileManager(IFileManager):
         """
         try:
             temp_dir = tempfile.mkdtemp(prefix=prefix)
-            self._temp_dirs.add(temp_dir)
+            with self._dirs_lock:
+                self._temp_dirs.add(temp_dir)
             return temp_dir
             
         except (OSError, PermissionError):
             return None
     
-    def cleanup_temp_files(self) -> None:
-        """Clean up any temporary files and directories created during processing."""
-        with self._cleanup_lock:
+    def cleanup_temp_files(self, sync: bool = True) -> None:
+        """
+        Clean up any temporary files and directories created during processing.
+        
+        Args:
+            sync: Remove temp directories before returning; pass False to hand
+                them to the shared background workers instead
+        """
+        with self._files_lock, self._dirs_lock:
             self._cleanup_temp_files_internal()
-            self._cleanup_temp_dirs_internal()
+            self._cleanup_temp_dirs_internal(sync)
+            callbacks = list(self._cleanup_callbacks)
+        
+        # Run callbacks after releasing the lock so they cannot block temp file creation
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+    
+    def _cached_stat(self, path: str) -> Optional[os.stat_result]:
+        """
+        Stat a path, reusing a result obtained within the last few milliseconds.
+        
+        Must be called with the files lock held.
+        
+        Args:
+            path: Path to stat
             
-            for callback in list(self._cleanup_callbacks):
-                try:
-                    callback()
-                except Exception:
-                    pass
+        Returns:
+            Stat result, or None if the path does not exist or cannot be accessed
+        """
+        now = time.monotonic()
+        cached = self._stat_cache.get(path)
+        if cached is not None and now - cached[1] < self._stat_cache_ttl:
+            return cached[0]
+        
+        try:
+            st: Optional[os.stat_result] = os.stat(path)
+        except (OSError, PermissionError):
+            st = None
+        self._stat_cache[path] = (st, now)
+        return st
+    
+    def _stat_tracked_files(self) -> Dict[str, os.stat_result]:
+        """
+        Stat all tracked temp files.
+        
+        Must be called with the files lock held.
+        
+        Returns:
+            Mapping of existing tracked file paths to their stat results
+        """
+        stats: Dict[str, os.stat_result] = {}
+        for temp_file in self._temp_files:
+            st = self._cached_stat(temp_file)
+            if st is not None:
+                stats[temp_file] = st
+        return stats
     
     def _cleanup_temp_files_internal(self) -> None:
         """Internal method to clean up temporary files."""
         files_to_remove = []
         
-        for temp_file in self._temp_files.copy():
+        for temp_file, pool_key in list(self._temp_files.items()):
+            # Remove directly; a file that is already gone counts as cleaned up
             try:
-                if os.path.exists(temp_file):
+                if not self._offer_to_pool(temp_file, pool_key):
                     os.remove(temp_file)
-                files_to_remove.append(temp_file)
-            except (OSError, PermissionError):
+            except FileNotFoundError:
                 pass
+            except (OSError, PermissionError):
+                continue
+            files_to_remove.append(temp_file)
+            self._stat_cache.pop(temp_file, None)
         for temp_file in files_to_remove:
-            self._temp_files.discard(temp_file)
+            self._temp_files.pop(temp_file, None)
     
-    def _cleanup_temp_dirs_internal(self) -> None:
-        """Internal method to clean up temporary directories."""
+    def _cleanup_temp_dirs_internal(self, sync: bool = True) -> None:
+        """
+        Internal method to clean up temporary directories.
+        
+        Args:
+            sync: Remove directories on the calling thread instead of the cleanup workers
+        """
         dirs_to_remove = []
         
         for temp_dir in self._temp_dirs.copy():
+            if not sync:
+                try:
+                    _get_cleanup_executor().submit(self._remove_temp_dir, temp_dir, True)
+                except RuntimeError:
+                    # Workers already shut down at exit, fall back to inline removal
+                    self._remove_temp_dir(temp_dir, True)
+                dirs_to_remove.append(temp_dir)
+                continue
+            
             try:
-                if os.path.exists(temp_dir):
-                    shutil.rmtree(temp_dir)
+                self._remove_temp_dir(temp_dir)
                 dirs_to_remove.append(temp_dir)
             except (OSError, PermissionError):
                 pass
         for temp_dir in dirs_to_remove:
             self._temp_dirs.discard(temp_dir)
     
+    @staticmethod
+    def _remove_temp_dir(temp_dir: str, ignore_errors: bool = False) -> None:
+        """
+        Remove a temporary directory, trying a plain rmdir before a recursive delete.
+        
+        Args:
+            temp_dir: Path to the directory
+            ignore_errors: Whether to suppress removal errors
+        """
+        try:
+            os.rmdir(temp_dir)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            if e.errno in (errno.ENOTEMPTY, errno.EEXIST):
+                shutil.rmtree(temp_dir, ignore_errors=ignore_errors)
+            elif not ignore_errors:
+                raise
+    
     def _cleanup_old_temp_files(self) -> None:
         """Clean up old temporary files to prevent accumulation."""
-        temp_files_with_time = []
-        
-        for temp_file in list(self._temp_files):
-            try:
-                if os.path.exists(temp_file):
-                    mtime = os.path.getmtime(temp_file)
-                    temp_files_with_time.append((temp_file, mtime))
-                else:
-                    self._temp_files.discard(temp_file)
-            except (OSError, PermissionError):
-                continue
-        
-        temp_files_with_time.sort(key=lambda x: x[1])
-        files_to_remove = temp_files_with_time[:len(temp_files_with_time) - self._cleanup_threshold]
+        stats = self._stat_tracked_files()
+        self._temp_files = {path: key for path, key in self._temp_files.items() if path in stats}
         
-        for temp_file, _ in files_to_remove:
-            try:
-                if os.path.exists(temp_file):
+        # Trim well below the threshold so the next few creates skip cleanup
+        excess = len(stats) - self._cleanup_threshold // 2
+        if excess > 0:
+            oldest = heapq.nsmallest(
+                excess,
+                ((st.st_mtime, temp_file) for temp_file, st in stats.items())
+            )
+            
+            for _, temp_file in oldest:
+                try:
                     os.remove(temp_file)
-                self._temp_files.discard(temp_file)
-            except (OSError, PermissionError):
-                pass
+                except FileNotFoundError:
+                    pass
+                except (OSError, PermissionError):
+                    continue
+                self._temp_files.pop(temp_file, None)
+        
+        self._stat_cache.clear()
     
     def get_temp_file_count(self) -> int:
         """
@@ -382,7 +879,7 @@ class FileManager(IFileManager):
             File size in bytes, or None if file doesn't exist or can't be accessed
         """
         try:
-            return Path(filepath).stat().st_size
+            return os.stat(filepath).st_size
         except (OSError, PermissionError):
             return None
     
@@ -397,13 +894,13 @@ class FileManager(IFileManager):
         Returns:
             File path with correct extension
         """
-        path = Path(filepath)
-        format_lower = format.lower()
+        extension = self._FORMAT_TO_EXT.get(format.lower())
+        if extension is None:
+            return filepath
         
-        if format_lower == 'txt' and path.suffix.lower() != '.txt':
-            return str(path.with_suffix('.txt'))
-        elif format_lower == 'json' and path.suffix.lower() != '.json':
-            return str(path.with_suffix('.json'))
+        root, suffix = os.path.splitext(filepath)
+        if suffix.lower() != extension:
+            return root + extension
         
         return filepath
     
@@ -483,17 +980,15 @@ class FileManager(IFileManager):
         Returns:
             Dictionary containing temp file statistics
         """
-        with self._cleanup_lock:
+        with self._files_lock, self._dirs_lock:
             existing_files = 0
             total_size = 0
             
-            for temp_file in self._temp_files:
-                try:
-                    if os.path.exists(temp_file):
-                        existing_files += 1
-                        total_size += os.path.getsize(temp_file)
-                except (OSError, PermissionError):
-                    pass
+            self._stat_cache.clear()
+            for st in self._stat_tracked_files().values():
+                existing_files += 1
+                total_size += st.st_size
+            self._stat_cache.clear()
             
             return {
                 'tracked_files': len(self._temp_files),
@@ -506,9 +1001,11 @@ class FileManager(IFileManager):
     
     def optimize_temp_file_management(self) -> None:
         """Optimize temporary file management by cleaning up and adjusting thresholds."""
-        with self._cleanup_lock:
+        with self._files_lock, self._dirs_lock:
             # Clean up non-existent files from tracking
-            self._temp_files = {f for f in self._temp_files if os.path.exists(f)}
+            self._stat_cache.clear()
+            stats = self._stat_tracked_files()
+            self._temp_files = {path: key for path, key in self._temp_files.items() if path in stats}
             self._temp_dirs = {d for d in self._temp_dirs if os.path.exists(d)}
             
             # Adjust cleanup threshold based on usage
@@ -516,4 +1013,6 @@ class FileManager(IFileManager):
             if current_count > self._cleanup_threshold * 2:
                 self._cleanup_threshold = min(self._cleanup_threshold + 5, 20)
             elif current_count < self._cleanup_threshold // 2:
-                self._cleanup_threshold = max(self._cleanup_threshold - 2, 5)
\ No newline at end of file
+                self._cleanup_threshold = max(self._cleanup_threshold - 2, 5)
+            
+            self._stat_cache.clear()
\ No newline at end of file
@@ -7,17 +7,46 @@ optimization utilities to ensure smooth operation during video processing.
 
 import time
 import threading
-import psutil
 import gc
-from typing import Dict, List, Optional, Callable
+import weakref
+from array import array
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional, Callable, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+# psutil is imported lazily by _get_psutil()
+_psutil: Optional[Any] = None
+
+
+def _get_psutil() -> Any:
+    """
+    Import psutil on first use so loading this module stays cheap.
+    
+    Returns:
+        The psutil module
+    """
+    global _psutil
+    if _psutil is None:
+        import psutil
+        _psutil = psutil
+    return _psutil
+
+
+class _GuiCounterOwner:
+    """Thread-local owner of a GUI update counter slot; collected when its thread ends."""
+    
+    __slots__ = ('slot', '__weakref__')
+    
+    def __init__(self, slot: List[int]):
+        self.slot = slot
+
 
 @dataclass
 class PerformanceMetrics:
     """Container for performance metrics."""
-    timestamp: datetime
+    timestamp: float  # time.monotonic() seconds; see as_datetime()
     memory_usage_mb: float
     cpu_percent: float
     thread_count: int
@@ -26,6 +55,19 @@ class PerformanceMetrics:
     processing_stage: str
 
 
+def as_datetime(timestamp: float) -> datetime:
+    """
+    Convert a monotonic metrics timestamp to wall-clock time.
+    
+    Args:
+        timestamp: Value of time.monotonic() at which a sample was taken
+        
+    Returns:
+        Local datetime corresponding to the sample
+    """
+    return datetime.fromtimestamp(time.time() - (time.monotonic() - timestamp))
+
+
 class PerformanceMonitor:
     """
     Monitor system performance and resource usage during video processing.
@@ -36,33 +78,86 @@ class PerformanceMonitor:
     
     def __init__(self):
         """Initialize the performance monitor."""
-        self._metrics_history: List[PerformanceMetrics] = []
-        self._monitoring_active = False
-        self._monitor_thread: Optional[threading.Thread] = None
-        self._monitor_lock = threading.Lock()
-        self._callbacks: List[Callable[[PerformanceMetrics], None]] = []
-        
         # Configuration
         self._sample_interval = 1.0  # Sample every second
+        self._idle_sample_interval = 5.0  # Back off while nothing is processing
         self._max_history_size = 300  # Keep 5 minutes of history
         self._memory_warning_threshold_mb = 1000
         self._cpu_warning_threshold = 80.0
+        self._min_gc_interval = 30.0  # Seconds between forced collections
+        
+        # psutil.Process reused across samples, created by _get_process()
+        self._process: Optional[Any] = None
         
         # Current state tracking
         self._current_stage = "idle"
-        self._gui_update_count = 0
+        # Each recording thread owns a one-element counter slot that only it
+        # writes; the sampler sums the slots and diffs against the last total.
+        # Slots of finished threads are folded into _gui_updates_retired.
+        self._gui_tls = threading.local()
+        self._gui_counters: Dict[int, List[int]] = {}
+        self._gui_counters_lock = threading.Lock()
+        self._gui_updates_retired = 0
+        self._gui_updates_seen = 0
         self._last_gui_update_time = time.time()
         self._temp_files_count = 0
+        self._last_gc_time = float('-inf')
+        self._last_gc_memory_mb = 0.0
+        
+        # Ring buffer: the deque evicts the oldest sample on append
+        self._metrics_history: Deque[PerformanceMetrics] = deque(
+            maxlen=self._max_history_size
+        )
+        # Columnar rings of the summary fields, written at a rolling head so
+        # summaries scan flat float arrays instead of dataclass instances
+        self._ts_ring = array('d', [0.0]) * self._max_history_size
+        self._mem_ring = array('d', [0.0]) * self._max_history_size
+        self._cpu_ring = array('d', [0.0]) * self._max_history_size
+        self._ring_head = 0
+        self._ring_count = 0
+        # Newest sample, published with a single attribute store so readers
+        # never have to take the monitor lock
+        self._latest_metrics: Optional[PerformanceMetrics] = None
+        # Set while no sampler is running; each start gets a fresh event so a
+        # sampler that outlives stop_monitoring's join can never be revived
+        self._stop_event = threading.Event()
+        self._stop_event.set()
+        # Cuts the wait between samples short on a stage change or stop
+        self._wake_event = threading.Event()
+        self._monitor_thread: Optional[threading.Thread] = None
+        self._monitor_lock = threading.Lock()
+        # Copy-on-write: replaced wholesale on add so the monitor thread can
+        # iterate its snapshot without locking
+        self._callbacks: Tuple[Callable[[PerformanceMetrics], None], ...] = ()
+        self._callbacks_lock = threading.Lock()
+        # Once a drain is scheduled on a Tk root, the sampler only queues
+        # samples and callbacks run on the GUI thread; the oldest are dropped
+        # if the GUI falls behind
+        self._pending_metrics: Deque[PerformanceMetrics] = deque(maxlen=64)
+        self._drain_root: Optional[Any] = None
+        # Root whose after() timer is currently armed; the timer only runs
+        # while callbacks are registered
+        self._drain_armed_root: Optional[Any] = None
+        self._drain_interval_ms = 200
+        self._drain_max_items = 10
+        self._callback_batch_size = 1
     
     def start_monitoring(self) -> None:
         """Start performance monitoring in a background thread."""
         with self._monitor_lock:
-            if self._monitoring_active:
+            if not self._stop_event.is_set():
                 return
             
-            self._monitoring_active = True
+            try:
+                self._get_process()
+            except Exception:
+                pass  # _collect_metrics falls back to zeroed samples
+            
+            self._stop_event = threading.Event()
+            self._wake_event.clear()
             self._monitor_thread = threading.Thread(
                 target=self._monitoring_loop,
+                args=(self._stop_event,),
                 daemon=True
             )
             self._monitor_thread.start()
@@ -70,10 +165,13 @@ class PerformanceMonitor:
     def stop_monitoring(self) -> None:
         """Stop performance monitoring."""
         with self._monitor_lock:
-            self._monitoring_active = False
-            
-            if self._monitor_thread and self._monitor_thread.is_alive():
-                self._monitor_thread.join(timeout=2.0)
+            self._stop_event.set()
+            self._wake_event.set()
+            monitor_thread = self._monitor_thread
+        
+        # Join outside the lock so the sampler can finish its last append
+        if monitor_thread and monitor_thread.is_alive():
+            monitor_thread.join(timeout=2.0)
     
     def set_processing_stage(self, stage: str) -> None:
         """
@@ -82,11 +180,35 @@ class PerformanceMonitor:
         Args:
             stage: Current processing stage name
         """
+        previous_stage = self._current_stage
         self._current_stage = stage
+        
+        if previous_stage == "idle" and stage != "idle":
+            # Sample the new stage now rather than after the idle backoff
+            self._wake_event.set()
     
     def record_gui_update(self) -> None:
         """Record a GUI update for rate calculation."""
-        self._gui_update_count += 1
+        owner = getattr(self._gui_tls, 'owner', None)
+        if owner is None:
+            slot = [0]
+            owner = self._gui_tls.owner = _GuiCounterOwner(slot)
+            with self._gui_counters_lock:
+                self._gui_counters[id(slot)] = slot
+            # Thread-local data is released when the thread ends
+            weakref.finalize(owner, self._retire_gui_counter, slot)
+        owner.slot[0] += 1
+    
+    def _retire_gui_counter(self, slot: List[int]) -> None:
+        """
+        Fold the counter slot of a finished thread into the retired total.
+        
+        Args:
+            slot: Counter slot owned by the finished thread
+        """
+        with self._gui_counters_lock:
+            if self._gui_counters.pop(id(slot), None) is not None:
+                self._gui_updates_retired += slot[0]
     
     def set_temp_files_count(self, count: int) -> None:
         """
@@ -104,7 +226,93 @@ class PerformanceMonitor:
         Args:
             callback: Function to call with new metrics
         """
-        self._callbacks.append(callback)
+        with self._callbacks_lock:
+            self._callbacks = self._callbacks + (callback,)
+        
+        root = self._drain_root
+        if root is not None and self._drain_armed_root is not root:
+            self._arm_callback_drain(root)
+    
+    def set_callback_batch_size(self, batch_size: int) -> None:
+        """
+        Set how many samples are combined into each callback update.
+        
+        Args:
+            batch_size: Samples per update; 1 delivers every sample
+        """
+        self._callback_batch_size = max(1, int(batch_size))
+    
+    def schedule_callback_drain(self, root: Any, interval_ms: int = 200,
+                                max_items: int = 10) -> None:
+        """
+        Run callbacks from the Tk event loop instead of the sampler thread.
+        
+        The timer is only armed while callbacks are registered, so an idle
+        application is not woken up to drain an empty queue.
+        
+        Args:
+            root: Tk root window whose after() timer drives the drain
+            interval_ms: Milliseconds between drains
+            max_items: Maximum queued samples delivered per drain
+        """
+        if self._drain_root is root:
+            return
+        
+        self._drain_interval_ms = interval_ms
+        self._drain_max_items = max_items
+        self._drain_root = root
+        if self._callbacks:
+            self._arm_callback_drain(root)
+    
+    def _arm_callback_drain(self, root: Any) -> None:
+        """
+        Start the after() timer that drains queued samples on a Tk root.
+        
+        Args:
+            root: Tk root window whose after() timer drives the drain
+        """
+        def drain() -> None:
+            if self._drain_root is not root:
+                # Superseded by a drain on another root
+                return
+            self.drain_pending_metrics(self._drain_max_items)
+            if not self._callbacks:
+                self._drain_armed_root = None
+                return
+            try:
+                root.after(self._drain_interval_ms, drain)
+            except Exception:
+                # Root destroyed; fall back to notifying from the sampler
+                self._drain_root = None
+                self._drain_armed_root = None
+        
+        self._drain_armed_root = root
+        try:
+            root.after(self._drain_interval_ms, drain)
+        except Exception:
+            self._drain_root = None
+            self._drain_armed_root = None
+    
+    def drain_pending_metrics(self, max_items: int = 10) -> int:
+        """
+        Deliver queued samples to the registered callbacks.
+        
+        Args:
+            max_items: Maximum number of samples to deliver
+            
+        Returns:
+            Number of samples delivered
+        """
+        pending = self._pending_metrics
+        delivered = 0
+        while delivered < max_items:
+            try:
+                metrics = pending.popleft()
+            except IndexError:
+                break
+            self._notify_callbacks(metrics)
+            delivered += 1
+        return delivered
     
     def get_current_metrics(self) -> Optional[PerformanceMetrics]:
         """
@@ -113,8 +321,7 @@ class PerformanceMonitor:
         Returns:
             Latest PerformanceMetrics or None if no data available
         """
-        with self._monitor_lock:
-            return self._metrics_history[-1] if self._metrics_history else None
+        return self._latest_metrics
     
     def get_metrics_history(self, minutes: int = 5) -> List[PerformanceMetrics]:
         """
@@ -126,13 +333,16 @@ class PerformanceMonitor:
         Returns:
             List of PerformanceMetrics from the specified time period
         """
-        cutoff_time = datetime.now().timestamp() - (minutes * 60)
+        cutoff_time = time.monotonic() - (minutes * 60)
         
         with self._monitor_lock:
-            return [
-                metric for metric in self._metrics_history
-                if metric.timestamp.timestamp() > cutoff_time
-            ]
+            # The history and the timestamp ring hold the same samples in the
+            # same order, so the ring's count locates the tail to copy
+            recent_count = self._count_samples_after(cutoff_time)
+            recent = list(islice(reversed(self._metrics_history), recent_count))
+        
+        recent.reverse()
+        return recent
     
     def get_performance_summary(self) -> Dict[str, float]:
         """
@@ -141,13 +351,15 @@ class PerformanceMonitor:
         Returns:
             Dictionary containing performance summary statistics
         """
-        recent_metrics = self.get_metrics_history(minutes=2)
+        cutoff_time = time.monotonic() - 120
         
-        if not recent_metrics:
-            return {}
+        with self._monitor_lock:
+            recent_count = self._count_samples_after(cutoff_time)
+            memory_values = self._ring_tail(self._mem_ring, recent_count)
+            cpu_values = self._ring_tail(self._cpu_ring, recent_count)
         
-        memory_values = [m.memory_usage_mb for m in recent_metrics]
-        cpu_values = [m.cpu_percent for m in recent_metrics]
+        if not memory_values:
+            return {}
         
         return {
             'avg_memory_mb': sum(memory_values) / len(memory_values),
@@ -155,9 +367,57 @@ class PerformanceMonitor:
             'avg_cpu_percent': sum(cpu_values) / len(cpu_values),
             'max_cpu_percent': max(cpu_values),
             'current_temp_files': self._temp_files_count,
-            'sample_count': len(recent_metrics)
+            'sample_count': len(memory_values)
         }
     
+    def _count_samples_after(self, cutoff_time: float) -> int:
+        """
+        Count the ring samples newer than a cutoff, by binary search.
+        
+        Timestamps are written in increasing order, so the ring is sorted
+        once read from its oldest slot. Must be called with _monitor_lock held.
+        
+        Args:
+            cutoff_time: Monotonic time samples must be newer than
+            
+        Returns:
+            Number of samples, counted back from the newest
+        """
+        size = self._max_history_size
+        count = self._ring_count
+        oldest = (self._ring_head - count) % size
+        timestamps = self._ts_ring
+        
+        # bisect_right over the logical (oldest-first) order of the ring
+        low, high = 0, count
+        while low < high:
+            mid = (low + high) // 2
+            if timestamps[(oldest + mid) % size] > cutoff_time:
+                high = mid
+            else:
+                low = mid + 1
+        
+        return count - low
+    
+    def _ring_tail(self, ring: array, length: int) -> array:
+        """
+        Copy the newest entries of a sample ring in oldest-first order.
+        
+        Must be called with _monitor_lock held.
+        
+        Args:
+            ring: One of the columnar sample rings
+            length: Number of newest entries to copy
+            
+        Returns:
+            Array of at most two contiguous slices of the ring
+        """
+        head = self._ring_head
+        start = head - length
+        if start >= 0:
+            return ring[start:head]
+        return ring[start:] + ring[:head]
+    
     def check_resource_warnings(self) -> List[str]:
         """
         Check for resource usage warnings.
@@ -199,8 +459,17 @@ class PerformanceMonitor:
         if current_metrics:
             # Memory optimization
             if current_metrics.memory_usage_mb > self._memory_warning_threshold_mb:
-                collected = gc.collect()
-                optimizations['memory'] = f"Garbage collection freed {collected} objects"
+                # A full collection stalls the process, so only force one
+                # occasionally and only while memory is still growing
+                now = time.monotonic()
+                if (now - self._last_gc_time > self._min_gc_interval and
+                        current_metrics.memory_usage_mb > self._last_gc_memory_mb):
+                    collected = gc.collect()
+                    self._last_gc_time = now
+                    self._last_gc_memory_mb = current_metrics.memory_usage_mb
+                    optimizations['memory'] = f"Garbage collection freed {collected} objects"
+                else:
+                    optimizations['memory'] = "Garbage collection skipped"
             
             # Adjust monitoring frequency based on CPU usage
             if current_metrics.cpu_percent > 50:
@@ -212,31 +481,124 @@ class PerformanceMonitor:
         
         return optimizations
     
-    def _monitoring_loop(self) -> None:
-        """Main monitoring loop running in background thread."""
-        while self._monitoring_active:
+    def _monitoring_loop(self, stop_event: threading.Event) -> None:
+        """
+        Main monitoring loop running in background thread.
+        
+        Args:
+            stop_event: Event that ends the loop
+        """
+        batch: List[PerformanceMetrics] = []
+        
+        while not stop_event.is_set():
             try:
                 metrics = self._collect_metrics()
                 
                 with self._monitor_lock:
                     self._metrics_history.append(metrics)
                     
-                    # Limit history size
-                    if len(self._metrics_history) > self._max_history_size:
-                        self._metrics_history = self._metrics_history[-self._max_history_size:]
+                    head = self._ring_head
+                    self._ts_ring[head] = metrics.timestamp
+                    self._mem_ring[head] = metrics.memory_usage_mb
+                    self._cpu_ring[head] = metrics.cpu_percent
+                    self._ring_head = (head + 1) % self._max_history_size
+                    if self._ring_count < self._max_history_size:
+                        self._ring_count += 1
+                self._latest_metrics = metrics
                 
-                # Notify callbacks
-                for callback in self._callbacks:
-                    try:
-                        callback(metrics)
-                    except Exception:
-                        pass  # Ignore callback errors
+                batch.append(metrics)
+                if len(batch) >= self._callback_batch_size:
+                    update = batch[0] if len(batch) == 1 else self._aggregate_metrics(batch)
+                    batch = []
+                    
+                    # Notify callbacks, or hand the update to the GUI thread
+                    if self._drain_root is None:
+                        self._notify_callbacks(update)
+                    elif self._callbacks:
+                        self._pending_metrics.append(update)
                 
-                time.sleep(self._sample_interval)
+                if self._wait_for_next_sample(stop_event):
+                    break
                 
             except Exception:
                 # Continue monitoring even if individual samples fail
-                time.sleep(self._sample_interval)
+                if self._wait_for_next_sample(stop_event):
+                    break
+    
+    @staticmethod
+    def _aggregate_metrics(batch: List[PerformanceMetrics]) -> PerformanceMetrics:
+        """
+        Combine a batch of samples into a single callback update.
+        
+        Args:
+            batch: Samples in collection order
+            
+        Returns:
+            Sample with mean memory, CPU and GUI rate, the peak thread count,
+            and the remaining fields of the newest sample
+        """
+        latest = batch[-1]
+        count = len(batch)
+        return PerformanceMetrics(
+            timestamp=latest.timestamp,
+            memory_usage_mb=sum(m.memory_usage_mb for m in batch) / count,
+            cpu_percent=sum(m.cpu_percent for m in batch) / count,
+            thread_count=max(m.thread_count for m in batch),
+            temp_files_count=latest.temp_files_count,
+            gui_update_rate=sum(m.gui_update_rate for m in batch) / count,
+            processing_stage=latest.processing_stage
+        )
+    
+    def _notify_callbacks(self, metrics: PerformanceMetrics) -> None:
+        """
+        Invoke the registered callbacks with a sample.
+        
+        Args:
+            metrics: Sample to deliver
+        """
+        callbacks = self._callbacks
+        for callback in callbacks:
+            try:
+                callback(metrics)
+            except Exception:
+                pass  # Ignore callback errors
+    
+    def _wait_for_next_sample(self, stop_event: threading.Event) -> bool:
+        """
+        Sleep until the next sample is due, backing off while idle.
+        
+        Args:
+            stop_event: Stop event of the calling monitoring loop
+            
+        Returns:
+            True if monitoring was stopped, False otherwise
+        """
+        if self._current_stage == "idle":
+            interval = self._idle_sample_interval
+        else:
+            interval = self._sample_interval
+        
+        self._wake_event.wait(interval)
+        self._wake_event.clear()
+        return stop_event.is_set()
+    
+    def _get_process(self) -> Any:
+        """
+        Get the psutil.Process for this process, creating it on first use.
+        
+        cpu_percent() measures against the previous call on the same Process
+        object, so it is primed here to make the first sample report real
+        usage instead of 0.0.
+        
+        Returns:
+            Shared psutil.Process instance
+        """
+        process = self._process
+        if process is None:
+            process = _get_psutil().Process()
+            process.cpu_percent(None)
+            self._process = process
+        return process
     
     def _collect_metrics(self) -> PerformanceMetrics:
         """
@@ -246,25 +608,32 @@ class PerformanceMonitor:
             PerformanceMetrics with current system state
         """
         try:
-            process = psutil.Process()
-            
-            # Memory usage
-            memory_info = process.memory_info()
-            memory_mb = memory_info.rss / (1024 * 1024)
+            process = self._get_process()
             
-            # CPU usage
-            cpu_percent = process.cpu_percent()
-            
-            # Thread count
-            thread_count = process.num_threads()
+            # Read all process fields from one /proc snapshot
+            with process.oneshot():
+                # Memory usage
+                memory_info = process.memory_info()
+                memory_mb = memory_info.rss / (1024 * 1024)
+                
+                # CPU usage
+                cpu_percent = process.cpu_percent()
+                
+                # Thread count
+                thread_count = process.num_threads()
             
             # GUI update rate calculation
             current_time = time.time()
             time_diff = current_time - self._last_gui_update_time
-            gui_update_rate = self._gui_update_count / max(time_diff, 1.0)
+            with self._gui_counters_lock:
+                gui_updates_total = self._gui_updates_retired + sum(
+                    slot[0] for slot in self._gui_counters.values()
+                )
+            gui_updates = gui_updates_total - self._gui_updates_seen
+            gui_update_rate = gui_updates / max(time_diff, 1.0)
             
             # Reset GUI update tracking
-            self._gui_update_count = 0
+            self._gui_updates_seen = gui_updates_total
             self._last_gui_update_time = current_time
             
         except Exception:
@@ -275,7 +644,7 @@ class PerformanceMonitor:
             gui_update_rate = 0.0
         
         return PerformanceMetrics(
-            timestamp=datetime.now(),
+            timestamp=time.monotonic(),
             memory_usage_mb=memory_mb,
             cpu_percent=cpu_percent,
             thread_count=thread_count,
@@ -338,7 +707,7 @@ class PerformanceOptimizer:
         
         # Get memory info before and after
         try:
-            process = psutil.Process()
+            process = _get_psutil().Process()
             memory_after = process.memory_info().rss / (1024 * 1024)
             optimizations['memory_after_mb'] = f"{memory_after:.1f}"
         except Exception:
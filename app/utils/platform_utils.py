@@ -10,6 +10,7 @@ import sys
 import platform
 import tkinter as tk
 from tkinter import ttk
+from functools import cached_property, lru_cache
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 
@@ -19,30 +20,36 @@ class PlatformInfo:
     
     def __init__(self):
         self.system = platform.system().lower()
-        self.release = platform.release()
-        self.version = platform.version()
-        self.machine = platform.machine()
-        self.processor = platform.processor()
         
-    @property
-    def is_windows(self) -> bool:
-        """Check if running on Windows."""
-        return self.system == 'windows'
+        # The platform cannot change at runtime, so the checks are plain
+        # attributes rather than properties re-evaluated on every access
+        self.is_windows = self.system == 'windows'
+        self.is_macos = self.system == 'darwin'
+        self.is_linux = self.system == 'linux'
+        self.is_unix_like = self.is_macos or self.is_linux
     
-    @property
-    def is_macos(self) -> bool:
-        """Check if running on macOS."""
-        return self.system == 'darwin'
+    # The remaining details are looked up on first use; platform.processor()
+    # in particular can spawn a subprocess
     
-    @property
-    def is_linux(self) -> bool:
-        """Check if running on Linux."""
-        return self.system == 'linux'
+    @cached_property
+    def release(self) -> str:
+        """Operating system release."""
+        return platform.release()
     
-    @property
-    def is_unix_like(self) -> bool:
-        """Check if running on Unix-like system (macOS or Linux)."""
-        return self.is_macos or self.is_linux
+    @cached_property
+    def version(self) -> str:
+        """Operating system version."""
+        return platform.version()
+    
+    @cached_property
+    def machine(self) -> str:
+        """Machine type, e.g. 'x86_64'."""
+        return platform.machine()
+    
+    @cached_property
+    def processor(self) -> str:
+        """Processor name, if the platform reports one."""
+        return platform.processor()
     
     def get_platform_name(self) -> str:
         """Get user-friendly platform name."""
@@ -59,65 +66,84 @@ class PlatformInfo:
 # Global platform info instance
 PLATFORM = PlatformInfo()
 
+# File dialog filters and options, fixed for the lifetime of the process
+if PLATFORM.is_macos:
+    # macOS prefers specific extensions and may handle some formats differently
+    _VIDEO_FILE_TYPES = (
+        ("Video files", "*.mp4 *.mov *.m4v *.avi *.mkv *.webm"),
+        ("MP4 files", "*.mp4 *.m4v"),
+        ("QuickTime files", "*.mov"),
+        ("AVI files", "*.avi"),
+        ("MKV files", "*.mkv"),
+        ("All files", "*")
+    )
+elif PLATFORM.is_windows:
+    # Windows supports WMV and has different handling
+    _VIDEO_FILE_TYPES = (
+        ("Video files", "*.mp4 *.avi *.mov *.mkv *.wmv *.flv *.webm *.m4v"),
+        ("MP4 files", "*.mp4 *.m4v"),
+        ("AVI files", "*.avi"),
+        ("MOV files", "*.mov"),
+        ("MKV files", "*.mkv"),
+        ("WMV files", "*.wmv"),
+        ("All files", "*.*")
+    )
+else:  # Linux and others
+    # Linux typically has good support for open formats
+    _VIDEO_FILE_TYPES = (
+        ("Video files", "*.mp4 *.avi *.mov *.mkv *.webm *.flv *.ogv"),
+        ("MP4 files", "*.mp4"),
+        ("AVI files", "*.avi"),
+        ("MKV files", "*.mkv"),
+        ("WebM files", "*.webm"),
+        ("All files", "*")
+    )
+
+_TRANSCRIPT_FILE_TYPES = (
+    ("Text files", "*.txt"),
+    ("JSON files", "*.json"),
+    ("All files", "*.*" if PLATFORM.is_windows else "*")
+)
+
+if PLATFORM.is_macos:
+    # macOS specific options
+    _DIALOG_OPTIONS = {
+        'message': None,  # Use title instead of message on macOS
+    }
+elif PLATFORM.is_windows:
+    # Windows specific options
+    _DIALOG_OPTIONS = {
+        'parent': None,  # Let Windows handle parent window
+    }
+else:  # Linux
+    # Linux specific options
+    _DIALOG_OPTIONS = {
+        'parent': None,
+    }
+
 
 class FileDialogConfig:
     """Platform-specific file dialog configurations."""
     
     @staticmethod
-    def get_video_file_types() -> List[Tuple[str, str]]:
+    def get_video_file_types() -> Tuple[Tuple[str, str], ...]:
         """
         Get platform-appropriate video file type filters.
         
         Returns:
-            List of (description, pattern) tuples for file dialog
+            Tuple of (description, pattern) tuples for file dialog
         """
-        base_types = [
-            ("Video files", "*.mp4 *.avi *.mov *.mkv *.wmv *.flv *.webm *.m4v"),
-            ("MP4 files", "*.mp4 *.m4v"),
-            ("AVI files", "*.avi"),
-            ("MOV files", "*.mov"),
-            ("MKV files", "*.mkv"),
-            ("WMV files", "*.wmv"),
-            ("All files", "*.*")
-        ]
-        
-        if PLATFORM.is_macos:
-            # macOS prefers specific extensions and may handle some formats differently
-            return [
-                ("Video files", "*.mp4 *.mov *.m4v *.avi *.mkv *.webm"),
-                ("MP4 files", "*.mp4 *.m4v"),
-                ("QuickTime files", "*.mov"),
-                ("AVI files", "*.avi"),
-                ("MKV files", "*.mkv"),
-                ("All files", "*")
-            ]
-        elif PLATFORM.is_windows:
-            # Windows supports WMV and has different handling
-            return base_types
-        else:  # Linux and others
-            # Linux typically has good support for open formats
-            return [
-                ("Video files", "*.mp4 *.avi *.mov *.mkv *.webm *.flv *.ogv"),
-                ("MP4 files", "*.mp4"),
-                ("AVI files", "*.avi"),
-                ("MKV files", "*.mkv"),
-                ("WebM files", "*.webm"),
-                ("All files", "*")
-            ]
+        return _VIDEO_FILE_TYPES
     
     @staticmethod
-    def get_transcript_file_types() -> List[Tuple[str, str]]:
+    def get_transcript_file_types() -> Tuple[Tuple[str, str], ...]:
         """
         Get platform-appropriate transcript file type filters.
         
         Returns:
-            List of (description, pattern) tuples for file dialog
+            Tuple of (description, pattern) tuples for file dialog
         """
-        return [
-            ("Text files", "*.txt"),
-            ("JSON files", "*.json"),
-            ("All files", "*.*" if PLATFORM.is_windows else "*")
-        ]
+        return _TRANSCRIPT_FILE_TYPES
     
     @staticmethod
     def get_dialog_options() -> Dict[str, Any]:
@@ -127,25 +153,29 @@ class FileDialogConfig:
         Returns:
             Dictionary of dialog options
         """
-        options = {}
-        
-        if PLATFORM.is_macos:
-            # macOS specific options
-            options.update({
-                'message': None,  # Use title instead of message on macOS
-            })
-        elif PLATFORM.is_windows:
-            # Windows specific options
-            options.update({
-                'parent': None,  # Let Windows handle parent window
-            })
-        else:  # Linux
-            # Linux specific options
-            options.update({
-                'parent': None,
-            })
-        
-        return options
+        # Unpacked with ** by callers, so the shared dict is never mutated
+        return _DIALOG_OPTIONS
+
+
+# Characters Windows rejects anywhere in a path
+_WINDOWS_INVALID_PATH_CHARS = frozenset('<>"|?*')
+# Extended-length path prefix, whose '?' is not part of the path itself
+_WINDOWS_EXTENDED_PREFIX = '\\\\?\\'
+
+
+@lru_cache(maxsize=256)
+def _normalize_path(path: str) -> str:
+    """Resolve a non-empty path, memoized since resolve() stats every component."""
+    # Convert to Path object for cross-platform handling
+    path_obj = Path(path)
+    
+    # Resolve to absolute path and normalize
+    try:
+        normalized = path_obj.resolve()
+        return str(normalized)
+    except (OSError, ValueError):
+        # If resolution fails, just normalize separators
+        return str(path_obj)
 
 
 class PathUtils:
@@ -165,16 +195,11 @@ class PathUtils:
         if not path:
             return path
         
-        # Convert to Path object for cross-platform handling
-        path_obj = Path(path)
+        if not os.path.isabs(path):
+            # Relative paths depend on the working directory; don't memoize
+            return _normalize_path.__wrapped__(path)
         
-        # Resolve to absolute path and normalize
-        try:
-            normalized = path_obj.resolve()
-            return str(normalized)
-        except (OSError, ValueError):
-            # If resolution fails, just normalize separators
-            return str(path_obj)
+        return _normalize_path(path)
     
     @staticmethod
     def get_default_directory(dir_type: str = "home") -> str:
@@ -209,23 +234,36 @@ class PathUtils:
             return str(Path.home())
     
     @staticmethod
-    def is_valid_path(path: str) -> bool:
+    def is_valid_path(path: str, strict: bool = False) -> bool:
         """
         Check if path is valid for the current platform.
         
         Args:
-            path: Path to validate
+            path: Path to validate, as a string or path-like object
+            strict: Also check that a Path object can be built from it
             
         Returns:
             True if path is valid, False otherwise
         """
-        if not path:
+        try:
+            path = os.fspath(path)
+        except TypeError:
             return False
+        if not path or not isinstance(path, str) or '\x00' in path:
+            return False
+        
+        if PLATFORM.is_windows:
+            checked = path[4:] if path.startswith(_WINDOWS_EXTENDED_PREFIX) else path
+            if not _WINDOWS_INVALID_PATH_CHARS.isdisjoint(checked):
+                return False
+        
+        if not strict:
+            return True
         
         try:
             Path(path)
             return True
-        except (ValueError, OSError):
+        except (ValueError, OSError, TypeError):
             return False
     
     @staticmethod
@@ -255,6 +293,93 @@ class PathUtils:
         return str(Path(*parts))
 
 
+def _configure_windows_style(root: tk.Tk) -> None:
+    """Apply Windows-specific styling."""
+    root.tk.call('source', 'azure.tcl')
+    root.tk.call('set_theme', 'light')
+
+
+def _configure_macos_style(root: tk.Tk) -> None:
+    """Apply macOS-specific styling."""
+    style = ttk.Style()
+    style.theme_use('aqua')
+    
+    # Configure macOS-specific options
+    root.option_add('*tearOff', False)
+
+
+def _configure_linux_style(root: tk.Tk) -> None:
+    """Apply Linux-specific styling."""
+    style = ttk.Style()
+    available_themes = style.theme_names()
+    
+    # Prefer modern themes
+    preferred_themes = ['clam', 'alt', 'default']
+    for theme in preferred_themes:
+        if theme in available_themes:
+            style.theme_use(theme)
+            break
+
+
+# Per-platform styling, keyed by PlatformInfo.system
+_STYLE_BY_PLATFORM: Dict[str, Dict[str, Any]] = {
+    'windows': {
+        'fonts': {
+            'default': ('Segoe UI', 9),
+            'monospace': ('Consolas', 9),
+            'heading': ('Segoe UI', 12),
+            'small': ('Segoe UI', 8)
+        },
+        'colors': {
+            'accent': '#0078d4',
+            'success': '#107c10',
+            'warning': '#ff8c00',
+            'error': '#d13438',
+            'background': '#ffffff',
+            'surface': '#f3f2f1'
+        },
+        'configure': _configure_windows_style
+    },
+    'darwin': {
+        'fonts': {
+            'default': ('SF Pro Text', 13),
+            'monospace': ('SF Mono', 12),
+            'heading': ('SF Pro Display', 16),
+            'small': ('SF Pro Text', 11)
+        },
+        'colors': {
+            'accent': '#007aff',
+            'success': '#34c759',
+            'warning': '#ff9500',
+            'error': '#ff3b30',
+            'background': '#ffffff',
+            'surface': '#f2f2f7'
+        },
+        'configure': _configure_macos_style
+    },
+    'linux': {
+        'fonts': {
+            'default': ('Ubuntu', 10),
+            'monospace': ('Ubuntu Mono', 10),
+            'heading': ('Ubuntu', 13),
+            'small': ('Ubuntu', 9)
+        },
+        'colors': {
+            'accent': '#e95420',
+            'success': '#0e8420',
+            'warning': '#f99500',
+            'error': '#c7162b',
+            'background': '#ffffff',
+            'surface': '#f6f6f6'
+        },
+        'configure': _configure_linux_style
+    }
+}
+
+# Other systems are styled like Linux
+_PLATFORM_STYLE = _STYLE_BY_PLATFORM.get(PLATFORM.system, _STYLE_BY_PLATFORM['linux'])
+
+
 class StyleUtils:
     """Platform-specific styling and appearance utilities."""
     
@@ -267,28 +392,7 @@ class StyleUtils:
             root: Root tkinter window
         """
         try:
-            if PLATFORM.is_windows:
-                # Windows-specific styling
-                root.tk.call('source', 'azure.tcl')
-                root.tk.call('set_theme', 'light')
-            elif PLATFORM.is_macos:
-                # macOS-specific styling
-                style = ttk.Style()
-                style.theme_use('aqua')
-                
-                # Configure macOS-specific options
-                root.option_add('*tearOff', False)
-            else:  # Linux
-                # Linux-specific styling
-                style = ttk.Style()
-                available_themes = style.theme_names()
-                
-                # Prefer modern themes
-                preferred_themes = ['clam', 'alt', 'default']
-                for theme in preferred_themes:
-                    if theme in available_themes:
-                        style.theme_use(theme)
-                        break
+            _PLATFORM_STYLE['configure'](root)
         except Exception:
             # If styling fails, continue with default
             pass
@@ -299,29 +403,9 @@ class StyleUtils:
         Get platform-appropriate font configurations.
         
         Returns:
-            Dictionary mapping font types to (family, size) tuples
+            Shared dictionary mapping font types to (family, size) tuples
         """
-        if PLATFORM.is_windows:
-            return {
-                'default': ('Segoe UI', 9),
-                'monospace': ('Consolas', 9),
-                'heading': ('Segoe UI', 12),
-                'small': ('Segoe UI', 8)
-            }
-        elif PLATFORM.is_macos:
-            return {
-                'default': ('SF Pro Text', 13),
-                'monospace': ('SF Mono', 12),
-                'heading': ('SF Pro Display', 16),
-                'small': ('SF Pro Text', 11)
-            }
-        else:  # Linux
-            return {
-                'default': ('Ubuntu', 10),
-                'monospace': ('Ubuntu Mono', 10),
-                'heading': ('Ubuntu', 13),
-                'small': ('Ubuntu', 9)
-            }
+        return _PLATFORM_STYLE['fonts']
     
     @staticmethod
     def get_platform_colors() -> Dict[str, str]:
@@ -329,35 +413,9 @@ class StyleUtils:
         Get platform-appropriate color scheme.
         
         Returns:
-            Dictionary mapping color names to hex values
+            Shared dictionary mapping color names to hex values
         """
-        if PLATFORM.is_windows:
-            return {
-                'accent': '#0078d4',
-                'success': '#107c10',
-                'warning': '#ff8c00',
-                'error': '#d13438',
-                'background': '#ffffff',
-                'surface': '#f3f2f1'
-            }
-        elif PLATFORM.is_macos:
-            return {
-                'accent': '#007aff',
-                'success': '#34c759',
-                'warning': '#ff9500',
-                'error': '#ff3b30',
-                'background': '#ffffff',
-                'surface': '#f2f2f7'
-            }
-        else:  # Linux
-            return {
-                'accent': '#e95420',
-                'success': '#0e8420',
-                'warning': '#f99500',
-                'error': '#c7162b',
-                'background': '#ffffff',
-                'surface': '#f6f6f6'
-            }
+        return _PLATFORM_STYLE['colors']
 
 
 class ScreenUtils:
@@ -378,9 +436,9 @@ class ScreenUtils:
             screen_width = root.winfo_screenwidth()
             screen_height = root.winfo_screenheight()
             
-            # Get DPI information
+            # Get DPI information (Tk reports a single value for both axes)
             dpi_x = root.winfo_fpixels('1i')
-            dpi_y = root.winfo_fpixels('1i')
+            dpi_y = dpi_x
             
             return {
                 'width': screen_width,
@@ -6,15 +6,154 @@ user preferences and application settings with JSON persistence.
 """
 
 import json
+import mmap
 import os
-import re
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Set, Tuple
 
 from ..core.models import ApplicationSettings
 from .error_handler import get_error_handler, ErrorCategory
 from .validation import SettingsValidator
 
+# Tk geometry 'WIDTHxHEIGHT+X+Y', shared with SettingsValidator
+_GEOMETRY_RE = SettingsValidator.GEOMETRY_PATTERN
+
+
+def _recompute_default_config_dir() -> Path:
+    """
+    Locate the default configuration directory.
+    
+    Returns:
+        Directory containing main.py, or the current directory if the
+        package is not running from a source checkout
+    """
+    global _DEFAULT_CONFIG_DIR
+    project_dir = Path(__file__).parents[2]
+    # An installed package sits in site-packages, which must not hold settings
+    is_installed = project_dir.name in ('site-packages', 'dist-packages')
+    if not is_installed and (project_dir / 'main.py').exists():
+        _DEFAULT_CONFIG_DIR = project_dir
+    else:
+        _DEFAULT_CONFIG_DIR = Path.cwd()
+    return _DEFAULT_CONFIG_DIR
+
+
+# Resolved once per process; the project layout doesn't change at runtime
+_DEFAULT_CONFIG_DIR: Path
+_recompute_default_config_dir()
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module is the fallback
+    orjson = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """
+    Parse UTF-8 JSON bytes, using orjson when it is installed.
+    
+    Args:
+        data: Raw JSON document
+        
+    Returns:
+        Parsed JSON value
+        
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_loads_mapped(fileno: int, size: int) -> Any:
+    """
+    Parse a JSON file through a read-only memory map, without a read() copy.
+    
+    Only orjson accepts a buffer; the stdlib json module needs bytes, so
+    callers should use _json_loads(f.read()) when orjson is unavailable.
+    
+    Args:
+        fileno: Descriptor of the open file
+        size: Size of the file in bytes; must be non-zero
+        
+    Returns:
+        Parsed JSON value
+        
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+        OSError: If the file cannot be mapped
+    """
+    mapped = mmap.mmap(fileno, size, access=mmap.ACCESS_READ)
+    try:
+        if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mapped) as view:
+            return orjson.loads(view)
+    finally:
+        mapped.close()
+
+
+def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize a value to UTF-8 JSON, using orjson when it is installed.
+    
+    Compact output keeps the stdlib encoder on its C fast path; indenting
+    falls back to the pure-Python encoder.
+    
+    Args:
+        obj: JSON-serializable value
+        pretty: Indent the output for reading by hand
+        
+    Returns:
+        Encoded JSON document
+        
+    Raises:
+        TypeError: If the value is not JSON-serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _validate_output_format(value: Any) -> Any:
+    """Check the default output format setting."""
+    if value not in ('txt', 'json'):
+        raise ValueError(f"Invalid output format: {value}. Must be 'txt' or 'json'")
+    return value
+
+
+def _validate_verbose_mode(value: Any) -> Any:
+    """Check the verbose mode setting."""
+    if not isinstance(value, bool):
+        raise ValueError(f"verbose_mode must be boolean, got {type(value)}")
+    return value
+
+
+def _make_string_validator(key: str) -> Callable[[Any], Any]:
+    """Create a validator requiring a string value for the given setting."""
+    def validate(value: Any) -> Any:
+        if not isinstance(value, str):
+            raise ValueError(f"{key} must be string, got {type(value)}")
+        return value
+    return validate
+
+
+def _validate_geometry(geometry: str) -> bool:
+    """Check a 'WIDTHxHEIGHT+X+Y' window geometry string."""
+    return _GEOMETRY_RE.match(geometry) is not None
+
+
+def _validate_window_geometry(value: Any) -> Any:
+    """Check the window geometry setting, replacing a malformed one with the default."""
+    if not isinstance(value, str):
+        raise ValueError(f"window_geometry must be string, got {type(value)}")
+    if value and not _validate_geometry(value):
+        return SettingsManager.DEFAULT_SETTINGS['window_geometry']
+    return value
+
 
 class SettingsManager:
     """
@@ -24,12 +163,40 @@ class SettingsManager:
     user preferences and application settings.
     """
     
-    DEFAULT_SETTINGS = {
-        'default_output_format': 'txt',
-        'verbose_mode': False,
-        'last_video_directory': '',
-        'last_output_directory': '',
-        'window_geometry': '800x600+100+100'
+    # Settings schema as (key, default) pairs; every dict derived from it
+    # shares one key order
+    _DEFAULT_ITEMS = (
+        ('default_output_format', 'txt'),
+        ('verbose_mode', False),
+        ('last_video_directory', ''),
+        ('last_output_directory', ''),
+        ('window_geometry', '800x600+100+100')
+    )
+    
+    DEFAULT_SETTINGS = dict(_DEFAULT_ITEMS)
+    
+    # Files at least this large are parsed from a memory map when orjson is
+    # available; below one page the mapping costs more than the copy it saves
+    MMAP_READ_THRESHOLD = 4096
+    
+    # Persisted fields, in file order; ApplicationSettings also has runtime
+    # tuning fields that are not saved, so dataclasses.asdict() won't do
+    _FIELD_NAMES = tuple(DEFAULT_SETTINGS)
+    
+    # Configuration directories already created or found by any instance
+    _dir_verified: Set[str] = set()
+    
+    # Encoded once; reset_to_defaults writes these bytes unchanged
+    _DEFAULT_SETTINGS_JSON = _json_dumps(DEFAULT_SETTINGS)
+    
+    # Per-key validators returning the value to store or raising ValueError;
+    # keys without an entry are ignored
+    _VALIDATORS: Dict[str, Callable[[Any], Any]] = {
+        'default_output_format': _validate_output_format,
+        'verbose_mode': _validate_verbose_mode,
+        'last_video_directory': _make_string_validator('last_video_directory'),
+        'last_output_directory': _make_string_validator('last_output_directory'),
+        'window_geometry': _validate_window_geometry
     }
     
     def __init__(self, config_dir: Optional[str] = None):
@@ -41,28 +208,38 @@ class SettingsManager:
                        If None, uses the same directory as the main script
         """
         if config_dir is None:
-            main_script_path = Path(__file__).parent.parent.parent / 'main.py'
-            if main_script_path.exists():
-                self.config_dir = main_script_path.parent
-            else:
-                self.config_dir = Path.cwd()
+            self.config_dir = _DEFAULT_CONFIG_DIR
         else:
             self.config_dir = Path(config_dir)
         
         self.config_file = self.config_dir / 'settings.json'
-        self._ensure_config_directory()
+        # Plain strings for the syscalls on the load/save paths
+        self._config_dir_str = str(self.config_dir)
+        self._config_file_str = str(self.config_file)
         
         # Set up error handling
         self.error_handler = get_error_handler()
         self.validator = SettingsValidator()
+        
+        self._ensure_config_directory()
+        
+        # Validated settings last read or written, keyed by the file's
+        # (mtime_ns, size) so edits made outside this instance are picked up
+        self._cached_settings: Optional[Dict[str, Any]] = None
+        self._cached_stat: Optional[Tuple[int, int]] = None
     
     def _ensure_config_directory(self) -> None:
         """Create the configuration directory if it doesn't exist."""
+        if self._config_dir_str in self._dir_verified:
+            return
+        
         try:
-            self.config_dir.mkdir(parents=True, exist_ok=True)
+            os.makedirs(self._config_dir_str, exist_ok=True)
         except OSError as e:
             self.error_handler.handle_settings_error(e, "create config directory", show_dialog=False)
             raise
+        
+        self._dir_verified.add(self._config_dir_str)
     
     def load_settings(self) -> ApplicationSettings:
         """
@@ -74,16 +251,30 @@ class SettingsManager:
         Raises:
             OSError: If there's an error reading the configuration file
         """
-        if not self.config_file.exists():
+        if self._cache_is_current():
+            return self._make_validated_settings(self._cached_settings)
+        
+        try:
+            f = open(self._config_file_str, 'rb')
+        except FileNotFoundError:
+            return self.get_default_settings()
+        except OSError as e:
+            self.error_handler.handle_settings_error(e, "load settings", show_dialog=False)
             return self.get_default_settings()
         
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                settings_dict = json.load(f)
+            with f:
+                # fstat the open file so the cache key matches what is read
+                st = os.fstat(f.fileno())
+                if orjson is not None and st.st_size >= self.MMAP_READ_THRESHOLD:
+                    settings_dict = _json_loads_mapped(f.fileno(), st.st_size)
+                else:
+                    settings_dict = _json_loads(f.read())
             
             validated_settings = self._validate_and_merge_settings(settings_dict)
+            self._update_cache(validated_settings, st)
             
-            return ApplicationSettings(**validated_settings)
+            return self._make_validated_settings(validated_settings)
             
         except (json.JSONDecodeError, OSError) as e:
             self.error_handler.handle_settings_error(e, "load settings", show_dialog=False)
@@ -101,15 +292,128 @@ class SettingsManager:
         """
         try:
             settings_dict = self._settings_to_dict(settings)
-            validated_settings = self._validate_and_merge_settings(settings_dict)
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(validated_settings, f, indent=2, ensure_ascii=False)
+            # Objects handed out by load_settings carry the dict they were
+            # validated from; unless a field has changed since, skip the
+            # validator pass
+            validated_settings = getattr(settings, '_validated_settings', None)
+            if validated_settings != settings_dict:
+                validated_settings = self._validate_and_merge_settings(settings_dict)
+            
+            # The GUI saves on many events that change nothing; skip the
+            # write when the file already holds exactly these settings
+            if validated_settings != self._cached_settings or not self._cache_is_current():
+                # Verbose users get an indented file they can inspect
+                encoded = _json_dumps(validated_settings, pretty=validated_settings['verbose_mode'])
+                st = self._write_settings_file(encoded)
+                self._update_cache(validated_settings, st)
+            settings._validated_settings = validated_settings
             
         except (OSError, TypeError) as e:
             self.error_handler.handle_settings_error(e, "save settings", show_dialog=True)
             raise
     
+    def _make_validated_settings(self, validated_settings: Dict[str, Any]) -> ApplicationSettings:
+        """
+        Build an ApplicationSettings tagged with the validated dict it came from.
+        
+        Args:
+            validated_settings: Output of _validate_and_merge_settings
+            
+        Returns:
+            ApplicationSettings object that save_settings can trust unchanged
+        """
+        settings = ApplicationSettings(**validated_settings)
+        settings._validated_settings = validated_settings
+        return settings
+    
+    def _write_settings_file(self, data: bytes) -> os.stat_result:
+        """
+        Atomically replace the configuration file with new contents.
+        
+        The data goes to a temporary file that is synced and renamed over the
+        configuration file, so readers never see a truncated or partial file.
+        
+        Args:
+            data: Encoded settings document
+            
+        Returns:
+            Stat result of the written file
+            
+        Raises:
+            OSError: If the file cannot be written or replaced
+        """
+        tmp_path = self._config_file_str + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+                st = os.fstat(f.fileno())
+            os.replace(tmp_path, self._config_file_str)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        
+        # Persist the rename itself; directories can't be opened on Windows
+        if os.name != 'nt':
+            try:
+                dir_fd = os.open(self._config_dir_str, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            except OSError:
+                pass
+        
+        return st
+    
+    def _cache_is_current(self) -> bool:
+        """
+        Check with one stat() whether the cached settings match the file.
+        
+        Returns:
+            True if a cached copy exists and the file is unchanged since
+        """
+        if self._cached_settings is None:
+            return False
+        try:
+            st = os.stat(self._config_file_str)
+        except OSError:
+            return False
+        return self._cached_stat == (st.st_mtime_ns, st.st_size)
+    
+    def _update_cache(self, settings_dict: Optional[Dict[str, Any]],
+                      st: Optional[os.stat_result]) -> None:
+        """
+        Remember validated settings together with the file state they match.
+        
+        Args:
+            settings_dict: Validated settings, or None to clear the cache
+            st: Stat result of the configuration file holding those settings
+        """
+        if settings_dict is None or st is None:
+            self._cached_settings = None
+            self._cached_stat = None
+        else:
+            self._cached_settings = settings_dict
+            self._cached_stat = (st.st_mtime_ns, st.st_size)
+    
+    @classmethod
+    def _fresh_defaults(cls) -> Dict[str, Any]:
+        """
+        Get a mutable copy of the default settings.
+        
+        Returns:
+            New dictionary of default settings
+        """
+        # copy() clones the compact table in one step; rebuilding with
+        # dict(_DEFAULT_ITEMS) would re-hash and insert every key
+        return cls.DEFAULT_SETTINGS.copy()
+    
     def get_default_settings(self) -> ApplicationSettings:
         """
         Get default application settings.
@@ -138,13 +442,7 @@ class SettingsManager:
     
     def _settings_to_dict(self, settings: ApplicationSettings) -> Dict[str, Any]:
         """Convert ApplicationSettings object to dictionary."""
-        return {
-            'default_output_format': settings.default_output_format,
-            'verbose_mode': settings.verbose_mode,
-            'last_video_directory': settings.last_video_directory,
-            'last_output_directory': settings.last_output_directory,
-            'window_geometry': settings.window_geometry
-        }
+        return {name: getattr(settings, name) for name in self._FIELD_NAMES}
     
     def _validate_and_merge_settings(self, settings_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -159,33 +457,17 @@ class SettingsManager:
         Raises:
             ValueError: If settings contain invalid values
         """
-        validated = self.DEFAULT_SETTINGS.copy()
+        # Untouched settings are the common case; the defaults are valid and
+        # immutable, so a copy of them is the answer without any checks
+        if settings_dict == self.DEFAULT_SETTINGS:
+            return self._fresh_defaults()
+        
+        validated = self._fresh_defaults()
+        validators = self._VALIDATORS
         for key, value in settings_dict.items():
-            if key not in self.DEFAULT_SETTINGS:
-                continue
-            
-            if key == 'default_output_format':
-                if value not in ['txt', 'json']:
-                    raise ValueError(f"Invalid output format: {value}. Must be 'txt' or 'json'")
-                validated[key] = value
-            
-            elif key == 'verbose_mode':
-                if not isinstance(value, bool):
-                    raise ValueError(f"verbose_mode must be boolean, got {type(value)}")
-                validated[key] = value
-            
-            elif key in ['last_video_directory', 'last_output_directory']:
-                if not isinstance(value, str):
-                    raise ValueError(f"{key} must be string, got {type(value)}")
-                validated[key] = value
-            
-            elif key == 'window_geometry':
-                if not isinstance(value, str):
-                    raise ValueError(f"window_geometry must be string, got {type(value)}")
-                if value and not self._validate_geometry_string(value):
-                    validated[key] = self.DEFAULT_SETTINGS[key]
-                else:
-                    validated[key] = value
+            validator = validators.get(key)
+            if validator is not None:
+                validated[key] = validator(value)
         
         return validated
     
@@ -199,35 +481,7 @@ class SettingsManager:
         Returns:
             True if format is valid, False otherwise
         """
-        try:
-            if 'x' not in geometry:
-                return False
-            
-            if '+' in geometry:
-                size_part, position_part = geometry.split('+', 1)
-            elif '-' in geometry:
-                parts = geometry.split('-')
-                if len(parts) < 2:
-                    return False
-                size_part = parts[0]
-                position_part = '-'.join(parts[1:])
-            else:
-                return False
-            
-            if 'x' not in size_part:
-                return False
-            width, height = size_part.split('x')
-            int(width)
-            int(height)
-            
-            position_pattern = r'^[+-]?\d+[+-]\d+$'
-            if not re.match(position_pattern, position_part):
-                return False
-            
-            return True
-            
-        except (ValueError, IndexError):
-            return False
+        return _validate_geometry(geometry)
     
     def reset_to_defaults(self) -> ApplicationSettings:
         """
@@ -236,9 +490,17 @@ class SettingsManager:
         Returns:
             ApplicationSettings object with default values
         """
-        default_settings = self.get_default_settings()
-        self.save_settings(default_settings)
-        return default_settings
+        # The defaults are known-valid, so write their pre-encoded form
+        # directly instead of going through validation and encoding
+        validated_settings = self._fresh_defaults()
+        try:
+            st = self._write_settings_file(self._DEFAULT_SETTINGS_JSON)
+        except OSError as e:
+            self.error_handler.handle_settings_error(e, "save settings", show_dialog=True)
+            raise
+        
+        self._update_cache(validated_settings, st)
+        return self._make_validated_settings(validated_settings)
     
     def get_config_file_path(self) -> Path:
         """
@@ -7,14 +7,22 @@ error messages and user feedback for file selection and settings.
 
 import os
 import re
+import stat
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict, Any
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Tuple, Optional, Dict, Any, Mapping, Sequence
 
-from .error_handler import get_error_handler, ErrorCategory
+from .error_handler import get_error_handler, ErrorCategory, ErrorHandler
+
+
+# Shared read-only containers for results without suggestions or details
+_EMPTY_SUGGESTIONS: Tuple[str, ...] = ()
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
 
 
-@dataclass
 class ValidationResult:
     """
     Result of a validation operation.
@@ -23,20 +31,77 @@ class ValidationResult:
         is_valid: Whether the validation passed
         error_message: Error message if validation failed
         warning_message: Optional warning message
-        suggestions: List of suggestions to fix the issue
-        details: Additional validation details
+        suggestions: Suggestions to fix the issue (read-only unless provided
+            by the caller; use add_suggestion to extend)
+        details: Additional validation details (read-only unless provided
+            by the caller; use set_detail to extend)
     """
-    is_valid: bool
-    error_message: Optional[str] = None
-    warning_message: Optional[str] = None
-    suggestions: List[str] = None
-    details: Dict[str, Any] = None
-    
-    def __post_init__(self):
-        if self.suggestions is None:
-            self.suggestions = []
-        if self.details is None:
-            self.details = {}
+    __slots__ = ('is_valid', 'error_message', 'warning_message', 'suggestions', 'details')
+    
+    def __init__(self, is_valid: bool, error_message: Optional[str] = None,
+                 warning_message: Optional[str] = None,
+                 suggestions: Optional[List[str]] = None,
+                 details: Optional[Dict[str, Any]] = None):
+        self.is_valid = is_valid
+        self.error_message = error_message
+        self.warning_message = warning_message
+        self.suggestions: Sequence[str] = suggestions if suggestions is not None else _EMPTY_SUGGESTIONS
+        self.details: Mapping[str, Any] = details if details is not None else _EMPTY_DETAILS
+    
+    def add_suggestion(self, suggestion: str) -> None:
+        """
+        Append a suggestion, replacing the shared empty container on first write.
+        
+        Args:
+            suggestion: Suggestion text to add
+        """
+        if not isinstance(self.suggestions, list):
+            self.suggestions = list(self.suggestions)
+        self.suggestions.append(suggestion)
+    
+    def set_detail(self, key: str, value: Any) -> None:
+        """
+        Set a detail value, replacing the shared empty container on first write.
+        
+        Args:
+            key: Detail name
+            value: Detail value
+        """
+        if not isinstance(self.details, dict):
+            self.details = dict(self.details)
+        self.details[key] = value
+    
+    def copy(self) -> 'ValidationResult':
+        """
+        Create an independent copy, so edits to it cannot reach this result.
+        
+        Returns:
+            ValidationResult with its own suggestions list and details dict
+        """
+        suggestions = list(self.suggestions) if self.suggestions else None
+        details = None
+        if self.details:
+            details = {key: list(value) if isinstance(value, list) else value
+                       for key, value in self.details.items()}
+        return ValidationResult(self.is_valid, self.error_message, self.warning_message,
+                                suggestions, details)
+    
+    def __repr__(self) -> str:
+        return (f"ValidationResult(is_valid={self.is_valid!r}, "
+                f"error_message={self.error_message!r}, "
+                f"warning_message={self.warning_message!r}, "
+                f"suggestions={list(self.suggestions)!r}, details={dict(self.details)!r})")
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.is_valid == other.is_valid
+                and self.error_message == other.error_message
+                and self.warning_message == other.warning_message
+                and list(self.suggestions) == list(other.suggestions)
+                and dict(self.details) == dict(other.details))
+    
+    __hash__ = None
 
 
 class FileValidator:
@@ -61,13 +126,32 @@ class FileValidator:
         '.m2ts': 'Blu-ray Video'
     }
     
+    # Extension listings used in unsupported-format results
+    _SUPPORTED_KEYS_LIST = list(SUPPORTED_EXTENSIONS.keys())
+    _SUPPORTED_LIST_STR = ', '.join(sorted(SUPPORTED_EXTENSIONS.keys()))
+    
     # Minimum and maximum file sizes (in bytes)
     MIN_FILE_SIZE = 1024  # 1 KB
     MAX_FILE_SIZE = 10 * 1024 * 1024 * 1024  # 10 GB
+    _MAX_GB = MAX_FILE_SIZE / (1024 * 1024 * 1024)
+    
+    # Characters not allowed in output filenames, plus a deletion table so
+    # the check runs as a single str.translate pass
+    _INVALID_FILENAME_CHARS = '<>:"|?*'
+    _INVALID_FILENAME_TRANS = str.maketrans('', '', _INVALID_FILENAME_CHARS)
+    
+    # Number of video file results remembered by validate_video_file
+    RESULT_CACHE_SIZE = 64
     
     def __init__(self):
         """Initialize the file validator."""
-        self.error_handler = get_error_handler()
+        self._result_cache: "OrderedDict[str, Tuple[Tuple[int, ...], ValidationResult]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+    
+    @property
+    def error_handler(self) -> Optional[ErrorHandler]:
+        """Global error handler, looked up only when an error is reported."""
+        return get_error_handler()
     
     def validate_video_file(self, filepath: str) -> ValidationResult:
         """
@@ -89,7 +173,10 @@ class FileValidator:
         try:
             path = Path(filepath)
             
-            if not path.exists():
+            # A single stat answers existence, file type and size at once
+            try:
+                file_stat = os.stat(filepath)
+            except (FileNotFoundError, NotADirectoryError):
                 return ValidationResult(
                     is_valid=False,
                     error_message=f"File does not exist: {filepath}",
@@ -100,85 +187,24 @@ class FileValidator:
                     ]
                 )
             
-            if not path.is_file():
-                return ValidationResult(
-                    is_valid=False,
-                    error_message=f"Path is not a file: {filepath}",
-                    suggestions=["Please select a file, not a directory"]
-                )
-            
-            extension = path.suffix.lower()
-            if extension not in self.SUPPORTED_EXTENSIONS:
-                supported_list = ', '.join(sorted(self.SUPPORTED_EXTENSIONS.keys()))
-                return ValidationResult(
-                    is_valid=False,
-                    error_message=f"Unsupported file format: {extension}",
-                    suggestions=[
-                        f"Supported formats: {supported_list}",
-                        "Convert your video to a supported format",
-                        "Try using a different video file"
-                    ],
-                    details={"extension": extension, "supported": list(self.SUPPORTED_EXTENSIONS.keys())}
-                )
-            
-            if not os.access(filepath, os.R_OK):
-                return ValidationResult(
-                    is_valid=False,
-                    error_message=f"File is not readable: {filepath}",
-                    suggestions=[
-                        "Check file permissions",
-                        "Ensure the file is not locked by another application",
-                        "Try running the application as administrator"
-                    ]
-                )
-            
-            file_size = path.stat().st_size
-            if file_size == 0:
-                return ValidationResult(
-                    is_valid=False,
-                    error_message="File is empty",
-                    suggestions=[
-                        "The video file appears to be empty or corrupted",
-                        "Try using a different video file"
-                    ]
-                )
-            
-            if file_size < self.MIN_FILE_SIZE:
-                return ValidationResult(
-                    is_valid=False,
-                    error_message=f"File is too small ({file_size} bytes)",
-                    suggestions=[
-                        f"Minimum file size is {self.MIN_FILE_SIZE} bytes",
-                        "The file may be corrupted or incomplete"
-                    ]
-                )
-            
-            if file_size > self.MAX_FILE_SIZE:
-                size_gb = file_size / (1024 * 1024 * 1024)
-                max_gb = self.MAX_FILE_SIZE / (1024 * 1024 * 1024)
-                return ValidationResult(
-                    is_valid=False,
-                    error_message=f"File is too large ({size_gb:.1f} GB)",
-                    suggestions=[
-                        f"Maximum file size is {max_gb:.1f} GB",
-                        "Try compressing the video or using a smaller file",
-                        "Split large videos into smaller segments"
-                    ]
-                )
-            
-            format_name = self.SUPPORTED_EXTENSIONS[extension]
-            size_mb = file_size / (1024 * 1024)
-            
-            return ValidationResult(
-                is_valid=True,
-                details={
-                    "file_size": file_size,
-                    "size_mb": size_mb,
-                    "extension": extension,
-                    "format_name": format_name,
-                    "path": str(path.resolve())
-                }
-            )
+            # Reuse the previous verdict while the file is unchanged. Relative
+            # paths are keyed by their absolute path so a cwd change misses,
+            # and callers get copies so they cannot alter the cached result.
+            abs_path = os.path.abspath(filepath)
+            cache_key = (file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_mode)
+            with self._result_cache_lock:
+                cached = self._result_cache.get(abs_path)
+                if cached is not None and cached[0] == cache_key:
+                    self._result_cache.move_to_end(abs_path)
+                    return cached[1].copy()
+            
+            result = self._check_video_stat(filepath, path, file_stat)
+            with self._result_cache_lock:
+                self._result_cache[abs_path] = (cache_key, result)
+                self._result_cache.move_to_end(abs_path)
+                if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+            return result.copy()
             
         except (OSError, PermissionError) as e:
             self.error_handler.handle_file_error("validate", filepath, e, show_dialog=False)
@@ -199,6 +225,85 @@ class FileValidator:
                 suggestions=["Try selecting a different file"]
             )
     
+    def _check_video_stat(self, filepath: str, path: Path,
+                          file_stat: os.stat_result) -> ValidationResult:
+        """
+        Run the type, format and size checks for a video file.
+        
+        Args:
+            filepath: Path to the video file being validated
+            path: Path object for filepath
+            file_stat: Result of stat() on filepath
+            
+        Returns:
+            ValidationResult containing validation outcome and details
+        """
+        if not stat.S_ISREG(file_stat.st_mode):
+            return ValidationResult(
+                is_valid=False,
+                error_message=f"Path is not a file: {filepath}",
+                suggestions=["Please select a file, not a directory"]
+            )
+        
+        extension = path.suffix.lower()
+        if extension not in self.SUPPORTED_EXTENSIONS:
+            return ValidationResult(
+                is_valid=False,
+                error_message=f"Unsupported file format: {extension}",
+                suggestions=[
+                    f"Supported formats: {self._SUPPORTED_LIST_STR}",
+                    "Convert your video to a supported format",
+                    "Try using a different video file"
+                ],
+                details={"extension": extension, "supported": self._SUPPORTED_KEYS_LIST}
+            )
+        
+        file_size = file_stat.st_size
+        if file_size < self.MIN_FILE_SIZE:
+            if file_size == 0:
+                return ValidationResult(
+                    is_valid=False,
+                    error_message="File is empty",
+                    suggestions=[
+                        "The video file appears to be empty or corrupted",
+                        "Try using a different video file"
+                    ]
+                )
+            return ValidationResult(
+                is_valid=False,
+                error_message=f"File is too small ({file_size} bytes)",
+                suggestions=[
+                    f"Minimum file size is {self.MIN_FILE_SIZE} bytes",
+                    "The file may be corrupted or incomplete"
+                ]
+            )
+        
+        if file_size > self.MAX_FILE_SIZE:
+            size_gb = file_size / (1024 * 1024 * 1024)
+            return ValidationResult(
+                is_valid=False,
+                error_message=f"File is too large ({size_gb:.1f} GB)",
+                suggestions=[
+                    f"Maximum file size is {self._MAX_GB:.1f} GB",
+                    "Try compressing the video or using a smaller file",
+                    "Split large videos into smaller segments"
+                ]
+            )
+        
+        format_name = self.SUPPORTED_EXTENSIONS[extension]
+        size_mb = file_size / (1024 * 1024)
+        
+        return ValidationResult(
+            is_valid=True,
+            details={
+                "file_size": file_size,
+                "size_mb": size_mb,
+                "extension": extension,
+                "format_name": format_name,
+                "path": os.path.abspath(filepath)
+            }
+        )
+    
     def validate_output_path(self, filepath: str) -> ValidationResult:
         """
         Validate an output file path with comprehensive checks.
@@ -217,14 +322,22 @@ class FileValidator:
             )
         
         try:
-            path = Path(filepath)
-            
             # Check parent directory
-            parent_dir = path.parent
-            if not parent_dir.exists():
+            parent_dir = os.path.dirname(filepath) or os.curdir
+            if not os.path.isdir(parent_dir):
                 try:
-                    parent_dir.mkdir(parents=True, exist_ok=True)
-                except (OSError, PermissionError) as e:
+                    os.makedirs(parent_dir, exist_ok=True)
+                except PermissionError:
+                    return ValidationResult(
+                        is_valid=False,
+                        error_message=f"Output directory is not writable: {parent_dir}",
+                        suggestions=[
+                            "Choose a different output location",
+                            "Check directory permissions",
+                            "Try running as administrator"
+                        ]
+                    )
+                except OSError:
                     return ValidationResult(
                         is_valid=False,
                         error_message=f"Cannot create output directory: {parent_dir}",
@@ -235,21 +348,17 @@ class FileValidator:
                         ]
                     )
             
-            # Check if parent directory is writable
-            if not os.access(parent_dir, os.W_OK):
-                return ValidationResult(
-                    is_valid=False,
-                    error_message=f"Output directory is not writable: {parent_dir}",
-                    suggestions=[
-                        "Choose a different output location",
-                        "Check directory permissions",
-                        "Try running as administrator"
-                    ]
-                )
-            
+            # Writability of an existing directory is left to the actual write,
+            # which reports permission problems through the error handler.
             # Check if file already exists and is writable
-            if path.exists():
-                if not path.is_file():
+            try:
+                file_stat = os.stat(filepath)
+            except (FileNotFoundError, NotADirectoryError):
+                file_stat = None
+            
+            filename = os.path.basename(filepath)
+            if file_stat is not None:
+                if not stat.S_ISREG(file_stat.st_mode):
                     return ValidationResult(
                         is_valid=False,
                         error_message=f"Output path exists but is not a file: {filepath}",
@@ -270,12 +379,11 @@ class FileValidator:
                 # Warn about overwriting
                 return ValidationResult(
                     is_valid=True,
-                    warning_message=f"File already exists and will be overwritten: {path.name}",
-                    details={"exists": True, "path": str(path.resolve())}
+                    warning_message=f"File already exists and will be overwritten: {filename}",
+                    details={"exists": True, "path": os.path.abspath(filepath)}
                 )
             
             # Validate filename
-            filename = path.name
             if not filename:
                 return ValidationResult(
                     is_valid=False,
@@ -284,13 +392,12 @@ class FileValidator:
                 )
             
             # Check for invalid characters in filename
-            invalid_chars = '<>:"|?*'
-            if any(char in filename for char in invalid_chars):
+            if len(filename.translate(self._INVALID_FILENAME_TRANS)) != len(filename):
                 return ValidationResult(
                     is_valid=False,
                     error_message=f"Filename contains invalid characters: {filename}",
                     suggestions=[
-                        f"Remove these characters: {invalid_chars}",
+                        f"Remove these characters: {self._INVALID_FILENAME_CHARS}",
                         "Use only letters, numbers, spaces, and basic punctuation"
                     ]
                 )
@@ -307,8 +414,8 @@ class FileValidator:
             return ValidationResult(
                 is_valid=True,
                 details={
-                    "path": str(path.resolve()),
-                    "directory": str(parent_dir.resolve()),
+                    "path": os.path.abspath(filepath),
+                    "directory": os.path.abspath(parent_dir),
                     "filename": filename,
                     "exists": False
                 }
@@ -351,12 +458,17 @@ class SettingsValidator:
     Enhanced settings validation with detailed error messages.
     """
     
-    VALID_OUTPUT_FORMATS = ['txt', 'json']
-    GEOMETRY_PATTERN = re.compile(r'^\d+x\d+[+-]\d+[+-]\d+$')
+    _VALID_FORMATS_ORDER = ('txt', 'json')
+    VALID_OUTPUT_FORMATS = frozenset(_VALID_FORMATS_ORDER)
+    _VALID_FORMATS_STR = ', '.join(_VALID_FORMATS_ORDER)
+    # 'WIDTHxHEIGHT' then '+X+Y' where X may carry its own sign ('+-10+20'),
+    # or '-X-Y' where X may too ('--10-20')
+    GEOMETRY_PATTERN = re.compile(r'^(\d+)x(\d+)(?:\+[+-]?\d+[+-]\d+|--?\d+-\d+)$')
     
-    def __init__(self):
-        """Initialize the settings validator."""
-        self.error_handler = get_error_handler()
+    @property
+    def error_handler(self) -> Optional[ErrorHandler]:
+        """Global error handler, looked up only when an error is reported."""
+        return get_error_handler()
     
     def validate_output_format(self, format_value: str) -> ValidationResult:
         """
@@ -375,19 +487,21 @@ class SettingsValidator:
                 suggestions=["Choose either 'txt' or 'json' format"]
             )
         
-        if format_value.lower() not in self.VALID_OUTPUT_FORMATS:
+        # Values coming from the UI are already lowercase, so only fold when needed
+        normalized = format_value if format_value in self.VALID_OUTPUT_FORMATS else format_value.lower()
+        if normalized not in self.VALID_OUTPUT_FORMATS:
             return ValidationResult(
                 is_valid=False,
                 error_message=f"Invalid output format: {format_value}",
                 suggestions=[
-                    f"Valid formats: {', '.join(self.VALID_OUTPUT_FORMATS)}",
+                    f"Valid formats: {self._VALID_FORMATS_STR}",
                     "Use 'txt' for plain text or 'json' for structured data"
                 ]
             )
         
         return ValidationResult(
             is_valid=True,
-            details={"format": format_value.lower()}
+            details={"format": normalized}
         )
     
     def validate_verbose_mode(self, verbose_value: Any) -> ValidationResult:
@@ -466,7 +580,7 @@ class SettingsValidator:
             
             return ValidationResult(
                 is_valid=True,
-                details={"path": str(path_obj.resolve()), "exists": True}
+                details={"path": os.path.abspath(path), "exists": True}
             )
             
         except Exception as e:
@@ -501,7 +615,8 @@ class SettingsValidator:
             )
         
         # Validate geometry format
-        if not self.GEOMETRY_PATTERN.match(geometry):
+        match = self.GEOMETRY_PATTERN.match(geometry)
+        if not match:
             return ValidationResult(
                 is_valid=False,
                 error_message=f"Invalid window geometry format: {geometry}",
@@ -512,42 +627,43 @@ class SettingsValidator:
                 ]
             )
         
-        try:
-            # Parse and validate dimensions
-            parts = geometry.replace('+', ' +').replace('-', ' -').split()
-            size_part = parts[0]
-            width, height = map(int, size_part.split('x'))
-            
-            # Validate reasonable dimensions
-            if width < 300 or height < 200:
-                return ValidationResult(
-                    is_valid=False,
-                    error_message=f"Window size too small: {width}x{height}",
-                    suggestions=["Minimum window size is 300x200"]
-                )
-            
-            if width > 3840 or height > 2160:
-                return ValidationResult(
-                    is_valid=False,
-                    error_message=f"Window size too large: {width}x{height}",
-                    suggestions=["Maximum window size is 3840x2160"]
-                )
-            
+        width, height = int(match.group(1)), int(match.group(2))
+        
+        # Validate reasonable dimensions
+        if width < 300 or height < 200:
             return ValidationResult(
-                is_valid=True,
-                details={
-                    "geometry": geometry,
-                    "width": width,
-                    "height": height
-                }
+                is_valid=False,
+                error_message=f"Window size too small: {width}x{height}",
+                suggestions=["Minimum window size is 300x200"]
             )
-            
-        except (ValueError, IndexError) as e:
+        
+        if width > 3840 or height > 2160:
             return ValidationResult(
                 is_valid=False,
-                error_message=f"Error parsing geometry: {str(e)}",
-                suggestions=["Use format: 'widthxheight+x+y'"]
+                error_message=f"Window size too large: {width}x{height}",
+                suggestions=["Maximum window size is 3840x2160"]
             )
+        
+        return ValidationResult(
+            is_valid=True,
+            details={
+                "geometry": geometry,
+                "width": width,
+                "height": height
+            }
+        )
+
+
+@lru_cache(maxsize=1)
+def _file_validator() -> FileValidator:
+    """Return the shared FileValidator, created on first use."""
+    return FileValidator()
+
+
+@lru_cache(maxsize=1)
+def _settings_validator() -> SettingsValidator:
+    """Return the shared SettingsValidator, created on first use."""
+    return SettingsValidator()
 
 
 def validate_transcription_request(video_path: str, output_path: str, 
@@ -564,8 +680,8 @@ def validate_transcription_request(video_path: str, output_path: str,
     Returns:
         Tuple of (is_valid, list_of_error_messages)
     """
-    file_validator = FileValidator()
-    settings_validator = SettingsValidator()
+    file_validator = _file_validator()
+    settings_validator = _settings_validator()
     
     errors = []
     
@@ -574,10 +690,12 @@ def validate_transcription_request(video_path: str, output_path: str,
     if not video_result.is_valid:
         errors.append(f"Video file: {video_result.error_message}")
     
-    # Validate output path
-    output_result = file_validator.validate_output_path(output_path)
-    if not output_result.is_valid:
-        errors.append(f"Output path: {output_result.error_message}")
+    # Validate output path; skipped when the video is already rejected so a
+    # failing request does not touch the file system (or create directories)
+    if not errors:
+        output_result = file_validator.validate_output_path(output_path)
+        if not output_result.is_valid:
+            errors.append(f"Output path: {output_result.error_message}")
     
     # Validate output format
     format_result = settings_validator.validate_output_format(output_format)
@@ -31,7 +31,6 @@ Import version information for use in dialogs and system info:
 
 Dependencies:
 - Python 3.8+: Core programming language
-- datetime: For build date and timestamp information
 - sys: For system information gathering
 - os: For environment and platform details
 
@@ -43,8 +42,8 @@ Version: 1.0.0-beta
 
 import os
 import sys
-from datetime import datetime
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Callable, Dict, Any
 
 
 # Application version information
@@ -62,16 +61,59 @@ if VERSION_BUILD:
 APP_NAME = "Video-to-Text"
 APP_DESCRIPTION = "A cross-platform GUI application for transcribing video files to text using speech recognition"
 APP_AUTHOR = "Anoop Kumar"
-APP_COPYRIGHT = f"© {datetime.now().year} {APP_AUTHOR}"
+COPYRIGHT_YEAR = 2025  # Updated as part of each release
+APP_COPYRIGHT = f"© {COPYRIGHT_YEAR} {APP_AUTHOR}"
 APP_LICENSE = "MIT License"
 APP_GITHUB_URL = "https://github.com/HelllGuest/video-to-text-gui"
 
 # Build information
-BUILD_DATE = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-PYTHON_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
 PLATFORM = sys.platform
 
 
+def _compute_build_date() -> str:
+    """Read the build date stamped into _build_info by release packaging."""
+    try:
+        from ._build_info import BUILD_DATE as stamped_build_date
+    except ImportError:
+        return "unknown"
+    return stamped_build_date
+
+
+def _compute_python_version() -> str:
+    """Format the running interpreter version as major.minor.micro."""
+    return f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+
+
+# BUILD_DATE and PYTHON_VERSION are computed on first access
+_LAZY_ATTRIBUTES: Dict[str, Callable[[], str]] = {
+    "BUILD_DATE": _compute_build_date,
+    "PYTHON_VERSION": _compute_python_version
+}
+
+
+def _lazy_attribute(name: str) -> str:
+    """
+    Return a lazily computed module attribute, caching it in the module globals.
+    
+    Args:
+        name: Name of the attribute in _LAZY_ATTRIBUTES
+        
+    Returns:
+        The computed attribute value
+    """
+    module_globals = globals()
+    if name not in module_globals:
+        module_globals[name] = _LAZY_ATTRIBUTES[name]()
+    return module_globals[name]
+
+
+def __getattr__(name: str) -> Any:
+    """Compute lazy module attributes on first access (PEP 562)."""
+    if name in _LAZY_ATTRIBUTES:
+        return _lazy_attribute(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_version_info() -> Dict[str, Any]:
     """
     Get comprehensive version and build information.
@@ -91,8 +133,8 @@ def get_version_info() -> Dict[str, Any]:
         "copyright": APP_COPYRIGHT,
         "license": APP_LICENSE,
         "github_url": APP_GITHUB_URL,
-        "build_date": BUILD_DATE,
-        "python_version": PYTHON_VERSION,
+        "build_date": _lazy_attribute("BUILD_DATE"),
+        "python_version": _lazy_attribute("PYTHON_VERSION"),
         "platform": PLATFORM
     }
 
@@ -122,8 +164,31 @@ Version {VERSION}
 {APP_COPYRIGHT}
 Licensed under {APP_LICENSE}
 
-Built with Python {PYTHON_VERSION} on {PLATFORM}
-Build Date: {BUILD_DATE}"""
+Built with Python {_lazy_attribute('PYTHON_VERSION')} on {PLATFORM}
+Build Date: {_lazy_attribute('BUILD_DATE')}"""
+
+
+@lru_cache(maxsize=1)
+def _get_platform_info() -> Dict[str, str]:
+    """
+    Get platform details that stay fixed for the life of the process.
+    
+    Returns:
+        Dictionary containing platform information
+    """
+    import platform
+    
+    return {
+        "Operating System": platform.system(),
+        "OS Version": platform.version(),
+        "OS Release": platform.release(),
+        "Architecture": platform.machine(),
+        "Processor": platform.processor(),
+        "Python Version": _lazy_attribute("PYTHON_VERSION"),
+        "Python Implementation": platform.python_implementation(),
+        "Python Compiler": platform.python_compiler(),
+        "Platform": PLATFORM
+    }
 
 
 def get_system_info() -> Dict[str, str]:
@@ -133,21 +198,9 @@ def get_system_info() -> Dict[str, str]:
     Returns:
         Dictionary containing system information
     """
-    import platform
-    
     try:
         # Get detailed platform information
-        system_info = {
-            "Operating System": platform.system(),
-            "OS Version": platform.version(),
-            "OS Release": platform.release(),
-            "Architecture": platform.machine(),
-            "Processor": platform.processor(),
-            "Python Version": PYTHON_VERSION,
-            "Python Implementation": platform.python_implementation(),
-            "Python Compiler": platform.python_compiler(),
-            "Platform": PLATFORM
-        }
+        system_info = dict(_get_platform_info())
         
         # Add memory information if available
         try:
@@ -164,41 +217,63 @@ def get_system_info() -> Dict[str, str]:
         return {"Error": f"Could not retrieve system information: {str(e)}"}
 
 
-def get_dependencies_info() -> Dict[str, str]:
+@lru_cache(maxsize=1)
+def _get_dependency_versions() -> Dict[str, str]:
     """
-    Get information about key dependencies.
+    Look up the versions of key dependencies once per process.
     
     Returns:
         Dictionary containing dependency versions
     """
+    from importlib.metadata import PackageNotFoundError, version
+    
     dependencies = {}
     
-    # Check for key dependencies
-    dependency_modules = [
-        ("tkinter", "tkinter"),
+    # tkinter ships with Python, so report the Tk version it was built against
+    try:
+        import tkinter
+        dependencies["tkinter"] = str(tkinter.TkVersion)
+    except ImportError:
+        dependencies["tkinter"] = "Not installed"
+    
+    # Read versions from package metadata without importing the packages
+    dependency_distributions = [
         ("moviepy", "moviepy"),
-        ("speech_recognition", "speech_recognition"),
+        ("speech_recognition", "SpeechRecognition"),
         ("psutil", "psutil")
     ]
     
-    for display_name, module_name in dependency_modules:
+    for display_name, distribution_name in dependency_distributions:
         try:
-            module = __import__(module_name)
-            version = getattr(module, '__version__', 'Unknown')
-            dependencies[display_name] = version
-        except ImportError:
-            dependencies[display_name] = "Not installed"
+            dependencies[display_name] = version(distribution_name)
+        except PackageNotFoundError:
+            # Frozen builds may lack package metadata; use an already loaded module
+            module = sys.modules.get(display_name)
+            if module is not None:
+                dependencies[display_name] = getattr(module, '__version__', 'Unknown')
+            else:
+                dependencies[display_name] = "Not installed"
         except Exception:
             dependencies[display_name] = "Error"
     
     return dependencies
 
 
+def get_dependencies_info() -> Dict[str, str]:
+    """
+    Get information about key dependencies.
+    
+    Returns:
+        Dictionary containing dependency versions
+    """
+    return dict(_get_dependency_versions())
+
+
 def print_version_info() -> None:
     """Print version information to console."""
     print(get_version_string())
-    print(f"Python {PYTHON_VERSION} on {PLATFORM}")
-    print(f"Build: {BUILD_DATE}")
+    print(f"Python {_lazy_attribute('PYTHON_VERSION')} on {PLATFORM}")
+    print(f"Build: {_lazy_attribute('BUILD_DATE')}")
 
 
 def print_full_info() -> None:
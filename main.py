@@ -23,6 +23,11 @@ Usage:
 To run the application, ensure you have Python 3.8+ installed with required dependencies.
 Then, execute the script:
     python main.py
+or run the package directly:
+    python -m app
+or install the package and use the console script:
+    pip install .
+    video-to-text
 
 Dependencies:
 - Python 3.8+: The core programming language.
@@ -38,49 +43,7 @@ Date: 01/08/2025 (DD/MM/YYYY)
 Version: 1.0.0-beta
 """
 
-import sys
-import os
-from pathlib import Path
-
-# Add the project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-
-def main():
-    """Main entry point for the application."""
-    import argparse
-    parser = argparse.ArgumentParser(description="Video-to-Text Transcription Tool")
-    parser.add_argument("--headless", action="store_true", help="Run in headless mode")
-    parser.add_argument("--video", type=str, help="Path to input video file (required for headless)")
-    parser.add_argument("--output", type=str, help="Path to output transcript file")
-    parser.add_argument("--format", type=str, default="txt", choices=["txt", "json"], help="Output format (default: txt)")
-    parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
-
-    args = parser.parse_args()
-
-    # Validate headless arguments
-    if args.headless and not args.video:
-        parser.error("--video is required when using --headless")
-
-    try:
-        from app import VideoToTextApp
-        
-        app = VideoToTextApp(
-            headless=args.headless,
-            input_file=args.video,
-            output_file=args.output,
-            output_format=args.format,
-            verbose=args.verbose
-        )
-        app.run()
-    except KeyboardInterrupt:
-        sys.exit(0)
-    except ImportError as e:
-        print(f"Error importing dependencies: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
-        sys.exit(1)
+from app.__main__ import main
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()